@@ -5,16 +5,53 @@ Advent of Code 2024-01
 """
 
 import argparse
+import itertools
+import sys
+import tempfile
+from pathlib import Path
 
-def similarity(left, right):
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.engines import REFERENCE, add_engine_argument, engine_functions # pylint: disable=wrong-import-position
+from aoc.external import ExternalSorter # pylint: disable=wrong-import-position
+from aoc.integers import integer_chunks, integers # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+def similarities(left, right):
     """
-    Calculate the similarity between the two lists
+    Each number on the left times how many times it turns up on the right
+
+    Both are sorted, so one merge pass over them finds the counts; a repeat on the
+    left reuses the last count.  They're only read front to back, so they can be
+    streams as well as lists
     """
-    simil=0
+    right = iter(right)
+    r = next(right, None)
+    count = 0
+    previous = None
     for l in left:
-        simil += l * right.count(l)
+        if l != previous:
+            while r is not None and r < l:
+                r = next(right, None)
+            count = 0
+            while r is not None and r == l:
+                r = next(right, None)
+                count += 1
+            previous = l
+        yield l * count
 
-    print(f"Total similarity: {simil}")
+def similarity(left, right):
+    """
+    Calculate the similarity between the two lists
+    """
+    return sum(similarities(left, right))
 
 def distance(left, right):
     """
@@ -24,30 +61,122 @@ def distance(left, right):
     for l, r in zip(left, right):
         dist += abs(r - l)
 
-    print(f"Total distance: {dist}")
+    return dist
 
-def main(inputfile):
+def parse(source):
     """
-    Process the input data
+    Read the two columns into sorted lists
+
+    Part 1 pairs the numbers up in sorted order, so all of them have to be held at
+    once: two lists of n ints, and nothing else, since the input is read in chunks
+    """
+    values = integers(source)
+    return sorted(values[0::2]), sorted(values[1::2])
+
+def external_answers(source, memory):
+    """
+    the distance and the similarity without ever holding the lists: each column is
+    sorted in runs on disk within half of `memory` bytes, and the runs are merged
+    back in order just once, for both answers
+
+    The distance pairs the columns up by position and the similarity by value, so
+    each merged column is split in two and both are walked in step; only the
+    numbers one has read ahead of the other are held, which is where the columns'
+    values drift apart
+    """
+    with tempfile.TemporaryDirectory(prefix="aoc-01-") as directory:
+        with ExternalSorter(memory // 2, directory) as left, \
+                ExternalSorter(memory // 2, directory) as right:
+            for values in integer_chunks(source):
+                left.extend(values[0::2])
+                right.extend(values[1::2])
+
+            left_pairs, left_joined = itertools.tee(left.merged())
+            right_pairs, right_joined = itertools.tee(right.merged())
+            dist = simil = 0
+            for l, r, product in zip(left_pairs, right_pairs,
+                                     similarities(left_joined, right_joined)):
+                dist += abs(r - l)
+                simil += product
+
+            return dist, simil
+
+def part1(lists):
+    return distance(*lists)
+
+def part2(lists):
+    return similarity(*lists)
+
+def numpy_parse(source):
+    """
+    Read the two columns into sorted int64 arrays
+    """
+    values = integers(source, as_numpy=True)
+    return numpy.sort(values[0::2]), numpy.sort(values[1::2])
+
+def numpy_distance(left, right):
+    return int(numpy.abs(right - left).sum())
+
+def numpy_similarity(left, right):
+    """
+    Count each distinct number on the right once, then look every left number up
+    in those with a binary search
     """
+    numbers, counts = numpy.unique(right, return_counts=True)
+    if numbers.size == 0:
+        return 0
+    found = numpy.minimum(numpy.searchsorted(numbers, left), len(numbers) - 1)
+    matched = numbers[found] == left
+    return int((left[matched] * counts[found[matched]]).sum())
 
-    left = []
-    right = []
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            (l, r) = line.split()
-            left.append(int(l))
-            right.append(int(r))
+def numpy_part1(lists):
+    return numpy_distance(*lists)
 
-    left.sort()
-    right.sort()
+def numpy_part2(lists):
+    return numpy_similarity(*lists)
+
+def batch_answers(sources, engine=REFERENCE):
+    """
+    The distance and similarity of every one of a batch of inputs, in order
+    """
+    functions = engine_functions(sys.modules[__name__], engine)
+    answers = []
+    for source in sources:
+        lists = functions["parse"](source)
+        answers.append((functions["part1"](lists), functions["part2"](lists)))
+
+    return answers
+
+ENGINES = {}
+if numpy is not None:
+    ENGINES["numpy"] = {"parse": numpy_parse, "part1": numpy_part1, "part2": numpy_part2}
+
+def main(inputfiles, memory_budget=None, engine=REFERENCE):
+    """
+    Process the input data
+    """
+    if memory_budget:
+        memory = memory_budget * 1024 * 1024
+        answers = [external_answers(inputfile, memory) for inputfile in inputfiles]
+    else:
+        answers = batch_answers(inputfiles, engine)
 
-    distance(left, right)
-    similarity(left, right)
+    for inputfile, (dist, simil) in zip(inputfiles, answers):
+        if len(inputfiles) > 1:
+            print(f"{inputfile}:")
+        print(f"Total distance: {dist}")
+        print(f"Total similarity: {simil}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-01")
-    parser.add_argument("input", help="input data file")
+    parser.add_argument("input", nargs="+", help="input data file(s)")
+    parser.add_argument("--memory-budget", type=int, metavar="MIB",
+                        help="sort on disk, holding about this much (plus the read buffers)"
+                        " at once; only the reference engine does this")
+    add_engine_argument(parser, ENGINES)
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    if args.memory_budget and args.engine != REFERENCE:
+        parser.error(f"--memory-budget sorts on disk, which the {args.engine} engine doesn't do")
+    run_profiled(args, main, args.input, args.memory_budget, args.engine)
@@ -5,68 +5,257 @@ Advent of Code 2024-02
 """
 
 import argparse
+import sys
+from itertools import combinations
+from pathlib import Path
 
-def safe(report, error_count):
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.engines import REFERENCE, add_engine_argument, engine_functions # pylint: disable=wrong-import-position
+from aoc.integers import integer_rows, rows_by_length # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+def first_unsafe(report, direction, start=0):
     """
-    Calculate whether a report is safe
+    The index of the first level after `start` that doesn't step 1 to 3 in
+    `direction` (1 up, -1 down) from the one before it; len(report) if they all do
     """
-    if len(report) < 2:
-        # only 1 report; let's assume that counts as safe
-        return True
+    if start >= len(report):
+        return len(report)
 
-    increasing = report[1] > report[0]
-    if error_count < 1 and len(report) > 2:
-        second_increasing = report[2] > report[1]
-        if second_increasing != increasing:
-            # it would have been better to just brute force all the permutations
-            remove_0 = report[1:]
-            remove_1 = [report[0]] + report[2:]
-            remove_2 = report[:2] + report[3:]
-            result = safe(remove_0, 1) or safe(remove_1, 1) or safe(remove_2, 1)
-            # print(f"{"safe" if result else "unsafe"}: {report}")
-            return result
+    previous = report[start]
+    for index in range(start + 1, len(report)):
+        level = report[index]
+        if not 1 <= (level - previous) * direction <= 3:
+            return index
+        previous = level
 
-    last_level = report[0]
-    for index, level in enumerate(report[1:]):
-        diff = abs(level - last_level)
-        if (level > last_level) != increasing or diff < 1 or diff > 3:
-            if error_count == 0:
-                index += 1 # to account for the '1:' when we started this loop
-                remove_prior = report[:index - 1] + report[index:]
-                remove_current = report[:index] + report[index + 1:]
-                result = safe(remove_prior, 1) or safe(remove_current, 1)
-                # print(f"{"safe" if result else "unsafe"}: {report}")
-                return result
+    return len(report)
 
-            return False
+def first_direction(report):
+    return 1 if len(report) > 1 and report[1] > report[0] else -1
 
-        last_level = level
+def safe(report):
+    """
+    Calculate whether a report is safe; the first step decides which way it has to go
+    """
+    return first_unsafe(report, first_direction(report)) == len(report)
 
-    return True
+def safe_without(report, direction, skip):
+    """
+    Whether the report is safe in `direction` with the level at `skip` left out,
+    given that every step before that level is: the level is stepped over by
+    index, rather than copying the report without it
+    """
+    end = len(report)
+    if 0 < skip < end - 1 and not 1 <= (report[skip + 1] - report[skip - 1]) * direction <= 3:
+        return False
+    return first_unsafe(report, direction, skip + 1) == end
 
+def safe_dampened(report, direction, bad):
+    """
+    Whether leaving out one level makes a report safe in `direction`, given the
+    first bad step ends at `bad`: only taking out one of the two levels around it
+    can help, since anything else leaves that step in place
+    """
+    return safe_without(report, direction, bad - 1) or safe_without(report, direction, bad)
 
-def main(inputfile):
+def verdicts(report):
     """
-    Process the input data
+    Whether a report is safe, and whether it is with the dampener, in one go
+    """
+    end = len(report)
+    direction = first_direction(report)
+    bad = first_unsafe(report, direction)
+    if bad == end:
+        return True, True
+    if safe_dampened(report, direction, bad):
+        return False, True
+
+    # taking out one of the first two levels could turn the report around
+    other = -direction
+    return False, safe_dampened(report, other, first_unsafe(report, other))
+
+def min_removals(report, limit):
     """
-    reports = []
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            reports.append([int(strint) for strint in line.split()])
+    The fewest levels that need taking out to make a report safe, or limit + 1 if
+    it takes more than `limit`
 
+    For each direction, fewest[i] is the fewest removals that leave a safe run
+    ending on level i: the best over the limit + 1 levels before it (a longer jump
+    would need too many removals), plus the ones jumped over.  That makes it
+    O(n * limit), where trying every way to remove them would be exponential
+    """
+    end = len(report)
+    if end == 0:
+        return 0
+
+    over = limit + 1
+    best = over
+    for direction in (1, -1):
+        fewest = [over] * end
+        for index in range(end):
+            level = report[index]
+            # or start the run here, taking out everything before it
+            removals = index if index < over else over
+            for before in range(max(0, index - over), index):
+                jumped = fewest[before] + index - before - 1
+                if jumped < removals and 1 <= (level - report[before]) * direction <= 3:
+                    removals = jumped
+            fewest[index] = removals
+            best = min(best, removals + end - 1 - index)
+
+    return best
+
+def safe_with_removals(report, max_removals=1):
+    """
+    Whether a report is safe with up to `max_removals` levels taken out; the
+    one-pass check covers the usual single removal
+    """
+    if max_removals == 0:
+        return safe(report)
+    if max_removals == 1:
+        return verdicts(report)[1]
+    if max_removals >= len(report) - 1 or safe(report):
+        return True
+    return min_removals(report, max_removals) <= max_removals
+
+def count_both(reports, max_removals=1):
+    """
+    both parts' counts in a single pass, holding one report at a time
+    """
     totalsafe = 0
+    totalsafe_dampened = 0
     for report in reports:
-        result = safe(report, 0)
-        # if not result:
-        #     print(report)
-        totalsafe += 1 if result else 0
+        if max_removals == 1:
+            strict, dampened = verdicts(report)
+        else:
+            strict = safe(report)
+            dampened = strict or safe_with_removals(report, max_removals)
+        totalsafe += strict
+        totalsafe_dampened += dampened
+
+    return totalsafe, totalsafe_dampened
+
+def parse(source):
+    """
+    Read one report per line
+    """
+    return list(integer_rows(source))
+
+def part1(reports):
+    return sum(1 for report in reports if safe(report))
+
+def part2(reports, max_removals=1):
+    return sum(1 for report in reports if safe_with_removals(report, max_removals))
+
+def numpy_steps_ok(steps, direction):
+    return (steps * direction >= 1) & (steps * direction <= 3)
+
+def numpy_safe_rows(levels):
+    """
+    Which rows of a 2D array of same-length reports are safe, all at once
+    """
+    steps = numpy.diff(levels, axis=1)
+    return numpy_steps_ok(steps, 1).all(axis=1) | numpy_steps_ok(steps, -1).all(axis=1)
+
+def numpy_safe_dampened(levels):
+    """
+    Which rows are safe with one level taken out, from a single diff: without level
+    j, a row keeps its steps before j - 1 and from j + 1 on (so it needs them all
+    fine, which running ands from either end give for every j at once), and gets
+    one merged step from j - 1 to j + 1
+    """
+    rows, width = levels.shape
+    if width <= 2:
+        return numpy.ones(rows, dtype=bool)
+
+    steps = numpy.diff(levels, axis=1)
+    safe_rows = numpy.zeros(rows, dtype=bool)
+    every = numpy.ones((rows, 1), dtype=bool)
+    for direction in (1, -1):
+        ok = numpy_steps_ok(steps, direction)
+        # before[:, i] is whether the first i steps are fine, after[:, i] the ones from i on
+        before = numpy.hstack((every, numpy.logical_and.accumulate(ok, axis=1)))
+        after = numpy.hstack((numpy.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1], every))
+        safe_rows |= after[:, 1] | before[:, width - 2]
+        for level in range(1, width - 1):
+            merged = numpy_steps_ok(steps[:, level - 1] + steps[:, level], direction)
+            safe_rows |= before[:, level - 1] & merged & after[:, level + 1]
+
+    return safe_rows
+
+def numpy_safe_with_removals(levels, max_removals=1):
+    """
+    Which rows are safe with up to `max_removals` levels taken out; beyond one,
+    every way of deleting that many columns is checked across all the rows still
+    unsafe at once, so the only loops are over those ways, never over reports
+    """
+    if max_removals == 0:
+        return numpy_safe_rows(levels)
+    safe_rows = numpy_safe_dampened(levels)
+
+    width = levels.shape[1]
+    for removals in range(2, min(max_removals, width) + 1):
+        unsafe = numpy.flatnonzero(~safe_rows)
+        if unsafe.size == 0:
+            break
+        candidates = levels[unsafe]
+        fixed = numpy.zeros(len(unsafe), dtype=bool)
+        for columns in combinations(range(width), removals):
+            fixed |= numpy_safe_rows(numpy.delete(candidates, columns, axis=1))
+        safe_rows[unsafe] = fixed
+
+    return safe_rows
+
+def numpy_parse(source):
+    """
+    Read the reports grouped by length, each group a 2D array with a report per row
+    """
+    return rows_by_length(source)
+
+def numpy_part1(groups):
+    return sum(int(numpy_safe_rows(levels).sum()) for levels in groups.values())
+
+def numpy_part2(groups, max_removals=1):
+    return sum(
+        int(numpy_safe_with_removals(levels, max_removals).sum()) for levels in groups.values()
+    )
+
+ENGINES = {}
+if numpy is not None:
+    ENGINES["numpy"] = {"parse": numpy_parse, "part1": numpy_part1, "part2": numpy_part2}
+
+def main(inputfile, max_removals=1, engine=REFERENCE):
+    """
+    Process the input data
+    """
+    if engine == REFERENCE:
+        totalsafe, totalsafe_dampened = count_both(integer_rows(inputfile), max_removals)
+    else:
+        functions = engine_functions(sys.modules[__name__], engine)
+        reports = functions["parse"](inputfile)
+        totalsafe = functions["part1"](reports)
+        totalsafe_dampened = functions["part2"](reports, max_removals)
 
     print(f"Total safe: {totalsafe}")
+    print(f"Total safe with dampener: {totalsafe_dampened}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-02")
     parser.add_argument("input", help="input data file")
+    parser.add_argument("--max-removals", type=int, default=1, metavar="K",
+                        help="levels the dampener may take out of a report (default: %(default)s)")
+    add_engine_argument(parser, ENGINES)
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input, args.max_removals, args.engine)
@@ -6,32 +6,84 @@ Advent of Code 2024-03
 
 import argparse
 import re
+import sys
+from itertools import chain
+from pathlib import Path
 
-def main(inputfile):
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_pieces # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+TOKENS = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+LONGEST = len(b"mul(999,999)")
+PIECE_SIZE = 1 << 16
+
+def scan(pieces):
     """
-    Process the input data
+    Add up the products of every valid mul instruction, and of only the enabled
+    ones, in one pass over the memory in pieces
+
+    A token can be cut in two where one piece ends, so only the tokens starting at
+    least LONGEST bytes before the end of what's been read are taken; the rest is
+    carried into the next piece, along with whether muls are enabled.  Nothing
+    more than a piece and that tail is held at once
+    """
+    total = 0
+    enabled_total = 0
+    enabled = True
+    tail = b""
+    for piece in chain(pieces, [None]):
+        buffer = tail + piece if piece is not None else tail
+        complete = len(buffer) if piece is None else len(buffer) - LONGEST + 1
+        resume = max(complete, 0)
+        for match in TOKENS.finditer(buffer):
+            if match.start() >= complete:
+                break
+            resume = max(resume, match.end())
+            left, right, do, dont = match.groups()
+            if do:
+                enabled = True
+            elif dont:
+                enabled = False
+            else:
+                product = int(left) * int(right)
+                total += product
+                if enabled:
+                    enabled_total += product
+        tail = buffer[resume:]
+
+    return total, enabled_total
+
+def parse(source):
     """
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        content = file.read()
+    Both parts' totals, from a single streaming pass over the memory; the parts
+    only pick theirs out, so running them separately doesn't read it twice
+    """
+    return scan(read_pieces(source, PIECE_SIZE))
 
-    dos = []
-    sections = content.split("don't()")
-    dos.append(sections[0])
-    for section in sections[1:]:
-        dos = dos + section.split("do()")[1:]
+def part1(totals):
+    return totals[0]
 
-    content = "".join(dos)
+def part2(totals):
+    # only the stretches from the start or a do() up to the next don't() count
+    return totals[1]
 
-    total = 0
-    pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    for match in re.finditer(pattern, content):
-        total += int(match.group(1)) * int(match.group(2))
+def main(inputfile):
+    """
+    Process the input data
+    """
+    totals = parse(inputfile)
 
-    print(f"total: {total}")
+    print(f"total: {part1(totals)}")
+    print(f"total with conditionals: {part2(totals)}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-03")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,11 +5,16 @@ Advent of Code 2024-04
 """
 
 import argparse
+import sys
+from pathlib import Path
 
-horizontals = {}
-verticals = {}
-diag1 = {}
-diag2 = {}
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 def bundle_strings(group):
     """
@@ -25,10 +30,11 @@ def register_char_in(char, cell_sum, group):
         group[cell_sum] = ""
     group[cell_sum] += char
 
-def register_char(char, row, col):
+def register_char(char, row, col, groups):
     """
     add a character to each of the four directional groups
     """
+    horizontals, verticals, diag1, diag2 = groups
     register_char_in(char, row, horizontals)
     register_char_in(char, col, verticals)
     register_char_in(char, row + col, diag1)
@@ -39,17 +45,15 @@ def count_xmas(grid):
     collect up lists of strings in all four directions (horizontal, vertical, both diagonals),
     then count 'XMAS' forward and reverse in each string
     """
-    width = len(grid[0])
-    height = len(grid)
-
-    for row in range(height):
-        for col in range(width):
-            register_char(grid[row][col], row, col)
+    # horizontals, verticals, diag1, diag2
+    groups = ({}, {}, {}, {})
+    for row, line in enumerate(grid.lines()):
+        for col, char in enumerate(line):
+            register_char(char, row, col, groups)
 
-    strings = bundle_strings(horizontals) \
-        + bundle_strings(verticals) \
-        + bundle_strings(diag1) \
-        + bundle_strings(diag2)
+    strings = []
+    for group in groups:
+        strings += bundle_strings(group)
 
     match_count = 0
     for string in strings:
@@ -59,18 +63,24 @@ def count_xmas(grid):
     return match_count
 
 
+def parse(source):
+    return Grid.parse(read_text(source))
+
+def part1(grid):
+    return count_xmas(grid)
+
 def main(inputfile):
     """
     Process the input data
     """
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+    grid = parse(inputfile)
 
-    print(count_xmas(grid))
+    print(part1(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-04")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,44 +5,58 @@ Advent of Code 2024-04
 """
 
 import argparse
+import sys
+from pathlib import Path
 
-def test_diag(grid, row, col, x_offset, y_offset):
-    """
-    test a given spot for MAS in both diagonal directions
-    """
-    first = grid[row - y_offset][col - x_offset]
-    second = grid[row + y_offset][col + x_offset]
-    return (first == "M" and second == "S") or (first == "S" and second == "M")
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+A = ord("A")
+# the two ends of a diagonal, either way round
+MAS = {(ord("M"), ord("S")), (ord("S"), ord("M"))}
 
 def count_xmas(grid):
     """
-    count the number of times MAS appears in both diagnal directions
+    count the number of times MAS appears in both diagnal directions;
+    the grid's border means the diagonals never need bounds checks
     """
-    width = len(grid[0])
-    height = len(grid)
+    down_right = grid.stride + 1
+    down_left = grid.stride - 1
 
+    cells = grid.cells
     match_count = 0
-    for row in range(1, height - 1):
-        for col in range(1, width - 1):
-            if grid[row][col] == "A":
-                if test_diag(grid, row, col, 1, 1) and test_diag(grid, row, col, -1, 1):
-                    match_count += 1
+    for index, cell in enumerate(cells):
+        if cell == A:
+            if ((cells[index - down_right], cells[index + down_right]) in MAS
+                    and (cells[index - down_left], cells[index + down_left]) in MAS):
+                match_count += 1
 
     return match_count
 
 
+def parse(source):
+    return Grid.parse(read_text(source))
+
+def part2(grid):
+    return count_xmas(grid)
+
 def main(inputfile):
     """
     Process the input data
     """
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+    grid = parse(inputfile)
 
-    print(count_xmas(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-04")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,6 +5,15 @@ Advent of Code 2024-05
 """
 
 import argparse
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 def fix_one_invalid(each, rules):
     """
@@ -61,33 +70,54 @@ def find_valid_prints(prints, rules):
 
     return (valid, invalid)
 
-def main(inputfile):
+def middle_sum(prints):
+    return sum(int(each[len(each) // 2]) for each in prints)
+
+def parse(source):
     """
-    Process the input data
+    Read the rules, then the prints
     """
     rules = []
     prints = []
     in_rules = True
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            line = line.strip()
-            if "" == line:
-                in_rules = False
-                continue
-            if in_rules:
-                rules += [line.split("|")]
-            else:
-                prints += [line.split(",")]
-
-    (valid, invalid) = find_valid_prints(prints, rules)
-    print(sum(int(each[len(each) // 2]) for each in valid))
+    for line in read_text(source).splitlines():
+        line = line.strip()
+        if "" == line:
+            in_rules = False
+            continue
+        if in_rules:
+            rules += [line.split("|")]
+        else:
+            prints += [line.split(",")]
+
+    return rules, prints
 
+def part1(parsed):
+    rules, prints = parsed
+    (valid, _) = find_valid_prints(prints, rules)
+    return middle_sum(valid)
+
+def part2(parsed):
+    rules, prints = parsed
+    (_, invalid) = find_valid_prints(prints, rules)
+    # fixing happens in place, so work on copies
+    invalid = [list(each) for each in invalid]
     fix_all_invalid(invalid, rules)
-    print(sum(int(each[len(each) // 2]) for each in invalid))
+    return middle_sum(invalid)
+
+def main(inputfile):
+    """
+    Process the input data
+    """
+    parsed = parse(inputfile)
+
+    print(part1(parsed))
+    print(part2(parsed))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-05")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
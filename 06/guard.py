@@ -5,62 +5,46 @@ Advent of Code 2024-06
 """
 
 import argparse
-
-def find_start(grid, start_char):
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == start_char:
-                return (row, col)
-
-    raise KeyError("No matching start_char")
-
-def stepping_off_edge(grid, row, col, direction):
-    if direction == "N" and row == 0:
-        return True
-    if direction == "E" and col == len(grid[0]) - 1:
-        return True
-    if direction == "S" and row == len(grid) - 1:
-        return True
-    if direction == "W" and col == 0:
-        return True
-    return False
-
-def turn_if_blocked(grid, row, col, direction):
-    if direction == "N" and grid[row - 1][col] == "#":
-        return turn_if_blocked(grid, row, col, "E")
-    if direction == "E" and grid[row][col + 1] == "#":
-        return turn_if_blocked(grid, row, col, "S")
-    if direction == "S" and grid[row + 1][col] == "#":
-        return turn_if_blocked(grid, row, col, "W")
-    if direction == "W" and grid[row][col - 1] == "#":
-        return turn_if_blocked(grid, row, col, "N")
-    return direction
-
-def take_step(row, col, direction):
-    if direction == "N":
-        return (row - 1, col)
-    if direction == "E":
-        return (row, col + 1)
-    if direction == "S":
-        return (row + 1, col)
-    if direction == "W":
-        return (row, col - 1)
-    raise ValueError(f"No such direction {direction}")
-
-def find_path_length(grid, row, col, direction):
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import OUTSIDE, Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+N = 0 # directions index into grid.offsets, which go N, E, S, W
+WALL = ord("#")
+VISITED = ord("X")
+
+def find_path_length(grid, index, direction):
+    """
+    walk from `index` until stepping off the edge, marking the path; -1 for a loop
+
+    This is the hot loop of part 2, so the cells and offsets are bound once and
+    the turning and stepping are done inline
+    """
+    cells = grid.cells
+    offsets = grid.offsets
     length = 1
     repeated_steps = 0
     repeated_step_max = 10000  # HACK
     while repeated_steps < repeated_step_max:
-        grid[row][col] = "X"
+        cells[index] = VISITED
 
-        if stepping_off_edge(grid, row, col, direction):
-            break
+        # turning if blocked
+        while cells[index + offsets[direction]] == WALL:
+            direction = (direction + 1) % 4
 
-        direction = turn_if_blocked(grid, row, col, direction)
-        (row, col) = take_step(row, col, direction)
+        # stepping off the edge, which may be the way it just turned to face
+        if cells[index + offsets[direction]] == OUTSIDE:
+            break
+        index += offsets[direction]
 
-        if grid[row][col] != "X":
+        if cells[index] != VISITED:
             length += 1
         else:
             repeated_steps += 1
@@ -69,44 +53,60 @@ def find_path_length(grid, row, col, direction):
         return -1
     return length
 
-def find_obstacle_locations(grid, start_row, start_col, direction):
+def find_obstacle_locations(grid, start, direction):
     obstacle_count = 0
-    grid_copy = [row[:] for row in grid]
-    for row, whole_row in enumerate(grid):
-        for col, value in enumerate(whole_row):
-            if row == start_row and col == start_col:
-                continue
-            if value == "X":
-                if evaluate_obsctacle(grid_copy, row, col, start_row, start_col, direction):
-                    obstacle_count += 1
+    grid_copy = grid.copy()
+    for index in grid.find_all(VISITED):
+        if index == start:
+            continue
+        if evaluate_obsctacle(grid_copy, index, start, direction):
+            obstacle_count += 1
 
     return obstacle_count
 
-def evaluate_obsctacle(grid, row, col, start_row, start_col, direction):
-    grid[row][col] = "#"
-    obstacle_length = find_path_length(grid, start_row, start_col, direction)
-    grid[row][col] = "X"
+def evaluate_obsctacle(grid, index, start, direction):
+    grid.cells[index] = WALL
+    obstacle_length = find_path_length(grid, start, direction)
+    grid.cells[index] = VISITED
 
     return obstacle_length < 0
 
 def print_grid(grid):
-    for row in grid:
-        print("".join(row))
+    for row in grid.lines():
+        print(row)
     print("")
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+def parse(source):
+    return Grid.parse(read_text(source))
+
+def walk_path(grid):
+    """
+    walk the guard out on a copy of the grid, marking the path with X
+    """
+    grid = grid.copy()
+    start = grid.find("^")
+    length = find_path_length(grid, start, N)
+    return grid, start, length
 
-    (start_row, start_col) = find_start(grid, "^")
-    print(find_path_length(grid, start_row, start_col, "N"))
+def part1(grid):
+    _, _, length = walk_path(grid)
+    return length
+
+def part2(grid):
+    grid, start, _ = walk_path(grid)
     # print_grid(grid)
+    return find_obstacle_locations(grid, start, N)
+
+def main(inputfile):
+    grid = parse(inputfile)
 
-    print(find_obstacle_locations(grid, start_row, start_col, "N"))
+    print(part1(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-06")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
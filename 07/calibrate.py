@@ -5,49 +5,104 @@ Advent of Code 2024-07
 """
 
 import argparse
+import sys
+from pathlib import Path
 
-def check_operations(desired, values):
-    # print(f"testing {desired} = {values}")
-    if desired % 1 != 0 or desired < 0:
-        return False
-    desired = int(desired)
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-    if len(values) == 1:
-        return desired == values[0]
+from aoc import counters # pylint: disable=wrong-import-position
+from aoc.integers import integer_rows # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
-    if check_operations(desired - values[-1], values[0:-1]):
-        # print(f"True: add: {desired} = {values}")
-        return True
+def check_operations(desired, values, concatenate=True):
+    """
+    whether +, * (and, with `concatenate`, ||) can combine `values` into `desired`,
+    worked backwards from the last value
 
-    if check_operations(desired / values[-1], values[0:-1]):
-        # print(f"True: multiply: {desired} = {values}")
-        return True
+    A depth-first search on an explicit stack, trying add, then multiply, then
+    concatenate, like the recursion it replaces; the states it visits are counted
+    in a local and reported once, so the counter costs nothing per state
+    """
+    visited = 0
+    found = False
+    stack = [(desired, len(values))]
+    while stack:
+        desired, length = stack.pop()
+        visited += 1
+        # print(f"testing {desired} = {values[:length]}")
+        if desired % 1 != 0 or desired < 0:
+            continue
+        desired = int(desired)
 
-    right = str(values[-1])
-    if str(desired).endswith(right):
-        left = str(desired)[:-len(right)]
-        if check_operations(int(left), values[0:-1]):
-            # print(f"True: concatenated: {desired} = {values}")
-            return True
+        if length == 1:
+            if desired == values[0]:
+                found = True
+                break
+            continue
 
-    return False
+        last = values[length - 1]
+        # pushed in reverse, so that they come off in the order they're tried
+        if concatenate:
+            text = str(desired)
+            right = str(last)
+            if len(text) > len(right) and text.endswith(right):
+                stack.append((int(text[:-len(right)]), length - 1))
+        stack.append((desired / last, length - 1))
+        stack.append((desired - last, length - 1))
 
-def main(inputfile):
+    counters.count("07/check_operations states", visited)
+    return found
+
+def calibration_total(equations, concatenate):
+    total = 0
+    for desired, values in equations:
+        if check_operations(desired, values, concatenate):
+            # print(f"got {desired} = {values}")
+            total += desired
+
+    return total
+
+def calibration_totals(equations):
+    """
+    both parts' totals in a single pass, holding one equation at a time
+    """
     total = 0
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            (desired, values) = line.split(":")
-            desired = int(desired)
-            values = [int(s) for s in values.split()]
-            if check_operations(desired, values):
-                # print(f"got {desired} = {values}")
-                total += desired
+    total_concatenated = 0
+    for desired, values in equations:
+        if check_operations(desired, values, False):
+            # anything that works without concatenation works with it
+            total += desired
+            total_concatenated += desired
+        elif check_operations(desired, values, True):
+            total_concatenated += desired
+
+    return total, total_concatenated
+
+def read_equations(source):
+    for desired, *values in integer_rows(source):
+        yield desired, values
+
+def parse(source):
+    return list(read_equations(source))
+
+def part1(equations):
+    return calibration_total(equations, False)
+
+def part2(equations):
+    return calibration_total(equations, True)
+
+def main(inputfile):
+    total, total_concatenated = calibration_totals(read_equations(inputfile))
 
     print(total)
+    print(total_concatenated)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-07")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
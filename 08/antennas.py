@@ -5,6 +5,18 @@ Advent of Code 2024-08
 """
 
 import argparse
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+EMPTY = ord(".")
 
 def add_antenna(antennas, value, row, col):
     if value not in antennas:
@@ -14,9 +26,11 @@ def add_antenna(antennas, value, row, col):
 
 def find_antennas(grid):
     antennas = {}
-    for row, row_data in enumerate(grid):
-        for col, value in enumerate(row_data):
-            if value != ".":
+    cells = grid.cells
+    for row in range(grid.height):
+        start = grid.index(row, 0)
+        for col, value in enumerate(cells[start:start + grid.width]):
+            if value != EMPTY:
                 add_antenna(antennas, value, row, col)
 
     return antennas
@@ -46,29 +60,55 @@ def find_antinodes_for_pair(left, right, max_rows, max_cols):
 
     return in_bounds
 
-def find_all_antinodes(all_antennas, max_rows, max_cols):
+def find_nearest_antinodes_for_pair(left, right, max_rows, max_cols):
+    row_offset = right[0] - left[0]
+    col_offset = right[1] - left[1]
+
+    in_bounds = []
+    before = (left[0] - row_offset, left[1] - col_offset)
+    after = (right[0] + row_offset, right[1] + col_offset)
+    for row, col in [before, after]:
+        if 0 <= row < max_rows and 0 <= col < max_cols:
+            in_bounds += [(row, col)]
+
+    return in_bounds
+
+def find_all_antinodes(all_antennas, max_rows, max_cols, find_for_pair=find_antinodes_for_pair):
     antinodes = []
     for antennas in all_antennas.values():
         for l, left in enumerate(antennas[0:-1]):
             for right in antennas[l+1:]:
-                antinodes += find_antinodes_for_pair(left, right, max_rows, max_cols)
+                antinodes += find_for_pair(left, right, max_rows, max_cols)
 
     return antinodes
 
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+def parse(source):
+    return Grid.parse(read_text(source))
 
+def count_antinodes(grid, find_for_pair):
     antennas = find_antennas(grid)
-    antinodes = find_all_antinodes(antennas, len(grid), len(grid[0]))
+    antinodes = find_all_antinodes(antennas, grid.height, grid.width, find_for_pair)
     # print(antinodes)
 
-    print(len(set(antinodes)))
+    return len(set(antinodes))
+
+def part1(grid):
+    return count_antinodes(grid, find_nearest_antinodes_for_pair)
+
+def part2(grid):
+    return count_antinodes(grid, find_antinodes_for_pair)
+
+def main(inputfile):
+    grid = parse(inputfile)
+
+    print(part1(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-08")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
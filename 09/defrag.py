@@ -5,6 +5,17 @@ Advent of Code 2024-09
 """
 
 import argparse
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+ZERO = ord("0")
 
 def expand_map(records):
     disk_map = []
@@ -43,20 +54,26 @@ def defrag(disk_map):
     return checksum
 
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        records = [int(record) for record in list(file.read().strip())]
-    # print(records)
+def parse(source):
+    with MappedInput(source) as disk_map:
+        return [digit - ZERO for digit in disk_map.stripped()]
 
+def part1(records):
     disk_map = expand_map(records)
     # print(disk_map)
 
-    print(defrag(disk_map))
-    # print(disk_map)
+    return defrag(disk_map)
+
+def main(inputfile):
+    records = parse(inputfile)
+    # print(records)
+
+    print(part1(records))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-09")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
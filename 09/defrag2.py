@@ -5,9 +5,22 @@ Advent of Code 2024-09
 """
 
 import argparse
+import heapq
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
-@dataclass
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.engines import REFERENCE, add_engine_argument, engine_functions # pylint: disable=wrong-import-position
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+ZERO = ord("0")
+
+@dataclass(slots=True)
 class Record:
     id: int
     size: int
@@ -66,22 +79,71 @@ def calc_checksum(records):
 
     return checksum
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        dense = [int(record) for record in list(file.read().strip())]
-    # print(dense)
+def parse(source):
+    with MappedInput(source) as disk_map:
+        return [digit - ZERO for digit in disk_map.stripped()]
 
+def part2(dense):
     records = convert_dense_to_records(dense)
     # print(records)
 
     defrag(records)
     # print(records)
 
-    print(calc_checksum(records))
+    return calc_checksum(records)
+
+def fast_part2(dense):
+    """
+    the same compaction, with the free space kept as a min-heap of start positions
+    for each gap length, so a file finds the leftmost gap it fits in from the tops of
+    nine heaps instead of scanning the disk; nothing is inserted into or popped from
+    the middle of a list
+    """
+    files = []
+    gaps = [[] for _ in range(10)]
+    position = 0
+    for index, size in enumerate(dense):
+        if index % 2 == 0:
+            files.append((position, size))
+        elif size:
+            # positions only grow, so each list is already a heap
+            gaps[size].append(position)
+        position += size
+
+    checksum = 0
+    for file_id in range(len(files) - 1, -1, -1):
+        start, size = files[file_id]
+        gap_length = 0
+        gap_start = start
+        for length in range(max(size, 1), 10):
+            if gaps[length] and gaps[length][0] < gap_start:
+                gap_length = length
+                gap_start = gaps[length][0]
+
+        if gap_length:
+            heapq.heappop(gaps[gap_length])
+            if gap_length > size:
+                heapq.heappush(gaps[gap_length - size], gap_start + size)
+            start = gap_start
+
+        checksum += file_id * (size * start + size * (size - 1) // 2)
+
+    return checksum
+
+ENGINES = {"fast": {"part2": fast_part2}}
+
+def main(inputfile, engine=REFERENCE):
+    functions = engine_functions(sys.modules[__name__], engine)
+    dense = functions["parse"](inputfile)
+    # print(dense)
+
+    print(functions["part2"](dense))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-09")
     parser.add_argument("input", help="input data file")
+    add_engine_argument(parser, ENGINES)
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input, args.engine)
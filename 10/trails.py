@@ -5,41 +5,60 @@ Advent of Code 2024-10
 """
 
 import argparse
+import sys
+from pathlib import Path
 
-def try_step(grid, r, c, new_r, new_c):
-    if 0 <= new_r < len(grid) and 0 <= new_c < len(grid[0]):
-        if grid[new_r][new_c] == grid[r][c] + 1:
-            if grid[new_r][new_c] == 9:
-                return [(new_r, new_c)]
-            return find_reachable_nines(grid, new_r, new_c)
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+TRAILHEAD = ord("0")
+PEAK = ord("9")
+
+def try_step(cells, offsets, index, new_index):
+    # heights are stored as digit characters, which still go up by one
+    if cells[new_index] == cells[index] + 1:
+        if cells[new_index] == PEAK:
+            return [new_index]
+        return find_reachable_nines(cells, offsets, new_index)
 
     return []
 
-def find_reachable_nines(grid, r, c):
+def find_reachable_nines(cells, offsets, index):
     reachable = []
-    reachable += try_step(grid, r, c, r - 1, c)
-    reachable += try_step(grid, r, c, r + 1, c)
-    reachable += try_step(grid, r, c, r, c - 1)
-    reachable += try_step(grid, r, c, r, c + 1)
+    for offset in offsets:
+        reachable += try_step(cells, offsets, index, index + offset)
 
     return reachable
 
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [[int(val) for val in line.strip()] for line in file]
+def parse(source):
+    return Grid.parse(read_text(source))
 
-    score = 0
-    for r, row in enumerate(grid):
-        for c, val in enumerate(row):
-            if val == 0:
-                score += len(find_reachable_nines(grid, r, c))
+def trailheads(grid):
+    for index in grid.find_all(TRAILHEAD):
+        yield find_reachable_nines(grid.cells, grid.offsets, index)
+
+def part1(grid):
+    return sum(len(set(reachable)) for reachable in trailheads(grid))
+
+def part2(grid):
+    return sum(len(reachable) for reachable in trailheads(grid))
+
+def main(inputfile):
+    grid = parse(inputfile)
 
-    print(score)
+    print(part1(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-10")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,8 +5,16 @@ Advent of Code 2024-11
 """
 
 import argparse
+import sys
+from pathlib import Path
 
-cache = {}
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.memo import memoize # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 def do_blinks(cur_val, blinks):
     if blinks == 0:
@@ -23,30 +31,42 @@ def do_blinks(cur_val, blinks):
 
     return cache_blinks(cur_val * 2024, blinks - 1)
 
+@memoize("11/blinks")
 def cache_blinks(cur_val, blinks):
-    key = (cur_val, blinks)
-    if key in cache:
-        return cache[key]
-
-    answer = do_blinks(cur_val, blinks)
-    cache[key] = answer
-
-    return answer
-
-def main(inputfile, blinks):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        stones = [int(val) for val in file.read().split()]
+    return do_blinks(cur_val, blinks)
 
+def count_stones(stones, blinks):
     total = 0
     for stone in stones:
         total += do_blinks(stone, blinks)
 
-    print(total)
+    return total
+
+def parse(source):
+    return [int(val) for val in read_text(source).split()]
+
+def part1(stones):
+    return count_stones(stones, 25)
+
+def part2(stones):
+    return count_stones(stones, 75)
+
+def main(inputfile, blinks=None):
+    stones = parse(inputfile)
+
+    if blinks is not None:
+        print(count_stones(stones, blinks))
+        return
+
+    print(part1(stones))
+    print(part2(stones))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-11")
     parser.add_argument("input", help="input data file")
-    parser.add_argument("blinks", type=int, help="number of times to blink")
+    parser.add_argument("blinks", type=int, nargs="?",
+                        help="number of times to blink (default: both parts)")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input, args.blinks)
+    run_profiled(args, main, args.input, args.blinks)
@@ -5,44 +5,38 @@ Advent of Code 2024-13
 """
 
 import argparse
+import sys
 from math import gcd, ceil, floor
 from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.integers import iter_integers # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 A_COST = 3
 B_COST = 1
+PRIZE_DISTANCE = 10000000000000
 
-@dataclass
+@dataclass(slots=True)
 class Offsets:
     x: int
     y: int
 
-@dataclass
+@dataclass(slots=True)
 class Machine:
     a: Offsets
     b: Offsets
     prize: Offsets
 
-def new_empty_machine(machines):
-    machine = Machine(Offsets(0, 0), Offsets(0, 0), Offsets(0, 0))
-    machines.append(machine)
-    return machine
-
-def update_machine(machine, line_type, x, y):
-    scale_factor = 0
-    if line_type == "Button A":
-        offset = machine.a
-    elif line_type == "Button B":
-        offset = machine.b
-    elif line_type == "Prize":
-        offset = machine.prize
-        scale_factor = 10000000000000
-    else:
-        raise ValueError(f"Invalid line type: {line_type}")
-
-    offset.x = int(x.strip()[2:]) + scale_factor
-    offset.y = int(y.strip()[2:]) + scale_factor
-
-def calc_required_tokens(machine):
+def move_prize(machine, distance):
+    prize = Offsets(machine.prize.x + distance, machine.prize.y + distance)
+    return Machine(machine.a, machine.b, prize)
+
+def calc_required_tokens(machine, max_presses=None):
     # system of equations:
     # A1 * x + B1 * y = P1
     # A2 * x + B2 * y = P2
@@ -63,33 +57,48 @@ def calc_required_tokens(machine):
     if floor(y) == y:
         x = (P1 - B1 * y) / A1
         if floor(x) == x:
+            if max_presses is not None and (x > max_presses or y > max_presses):
+                return 0
             return int(x * A_COST + y * B_COST)
 
     return 0
 
-def main(inputfile):
-    machines = []
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        current_machine = new_empty_machine(machines)
-        for line in file:
-            line = line.strip()
-            if line == "":
-                current_machine = new_empty_machine(machines)
-                continue
-
-            line_type, vals = line.split(":")
-            x, y = vals.split(",")
-            update_machine(current_machine, line_type, x, y)
+def read_machines(source):
+    # every machine is six numbers: button A's x and y, button B's, then the prize's
+    values = iter_integers(source)
+    for ax, ay, bx, by, px, py in zip(values, values, values, values, values, values):
+        yield Machine(Offsets(ax, ay), Offsets(bx, by), Offsets(px, py))
+
+def parse(source):
+    return list(read_machines(source))
 
+def part1_tokens(machine):
+    return calc_required_tokens(machine, 100)
+
+def part2_tokens(machine):
+    return calc_required_tokens(move_prize(machine, PRIZE_DISTANCE))
+
+def part1(machines):
+    return sum(part1_tokens(machine) for machine in machines)
+
+def part2(machines):
+    return sum(part2_tokens(machine) for machine in machines)
+
+def main(inputfile):
+    # both parts in one pass, holding one machine at a time
     tokens = 0
-    for machine in machines:
-        tokens += calc_required_tokens(machine)
+    far_tokens = 0
+    for machine in read_machines(inputfile):
+        tokens += part1_tokens(machine)
+        far_tokens += part2_tokens(machine)
 
     print(tokens)
+    print(far_tokens)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-13")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,54 +5,60 @@ Advent of Code 2024-14
 """
 
 import argparse
-import time
+import sys
+from array import array
 from dataclasses import dataclass
-
-@dataclass
-class Robot:
-    x: int
-    y: int
-    dx: int
-    dy: int
-
-    def move(self, steps, width, height):
-        for _ in range(steps):
-            self.x += self.dx
-            self.y += self.dy
-        self.x %= width
-        self.y %= height
-        if self.x < 0:
-            self.x += width
-        if self.y < 0:
-            self.y += height
-
-
-def extract_values(line_part):
-    _, values = line_part.split("=")
-    x, y = values.split(",")
-    return int(x), int(y)
-
-def parse_line(line):
-    p, v = line.split()
-    x, y = extract_values(p)
-    dx, dy = extract_values(v)
-    return Robot(x, y, dx, dy)
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.integers import integers # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+@dataclass(slots=True)
+class Robots:
+    """
+    the whole swarm as parallel arrays, one entry per robot, rather than an object each
+    """
+    x: array
+    y: array
+    dx: array
+    dy: array
+
+    def __len__(self):
+        return len(self.x)
+
+    def positions(self):
+        return zip(self.x, self.y)
+
+    def moved(self, steps, width, height):
+        """
+        where the swarm is `steps` later; it wraps around, so that's one multiply each
+        """
+        return Robots(
+            array('q', [(x + dx * steps) % width for x, dx in zip(self.x, self.dx)]),
+            array('q', [(y + dy * steps) % height for y, dy in zip(self.y, self.dy)]),
+            self.dx,
+            self.dy,
+        )
 
 def safety_factor(robots, mid_width, mid_height):
     nw = 0
     ne = 0
     se = 0
     sw = 0
-    for robot in robots:
-        if robot.x < mid_width:
-            if robot.y < mid_height:
+    for x, y in robots.positions():
+        if x < mid_width:
+            if y < mid_height:
                 nw += 1
-            elif robot.y > mid_height:
+            elif y > mid_height:
                 sw += 1
-        elif robot.x > mid_width:
-            if robot.y < mid_height:
+        elif x > mid_width:
+            if y < mid_height:
                 ne += 1
-            elif robot.y > mid_height:
+            elif y > mid_height:
                 se += 1
 
     # print(nw, ne, se, sw)
@@ -66,41 +72,57 @@ def print_grid(robots, width, height):
         for _ in range(width):
             row.append(".")
 
-    for robot in robots:
-        if grid[robot.y][robot.x] == ".":
-            grid[robot.y][robot.x] = "1"
+    for x, y in robots.positions():
+        if grid[y][x] == ".":
+            grid[y][x] = "1"
         else:
-            grid[robot.y][robot.x] = str(int(grid[robot.y][robot.x]) + 1)
+            grid[y][x] = str(int(grid[y][x]) + 1)
 
     for row in grid:
         print("".join(row))
 
-def take_steps(robots, steps, width, height):
-    for robot in robots:
-        robot.move(steps, width, height)
-    return steps
+def parse(source):
+    """
+    part 2 needs every robot at once, so they're all kept, as four arrays of ints
+    """
+    values = integers(source)
+    return Robots(values[0::4], values[1::4], values[2::4], values[3::4])
+
+def part1(robots, width=101, height=103):
+    return safety_factor(robots.moved(100, width, height), width // 2, height // 2)
+
+def part2(robots, width=101, height=103):
+    """
+    the robots bunch up to draw the tree, which drags the safety factor way down,
+    and the whole pattern repeats after width * height steps
+    """
+    best_steps = 0
+    best_sf = safety_factor(robots, width // 2, height // 2)
+    for total_steps in range(1, width * height + 1):
+        robots = robots.moved(1, width, height)
+        sf = safety_factor(robots, width // 2, height // 2)
+        if sf < best_sf:
+            best_steps = total_steps
+            best_sf = sf
+
+    return best_steps
 
 def main(inputfile, width, height):
-    robots = []
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            robots.append(parse_line(line))
-
-    total_steps = 0
-    for _ in range(10000):
-        total_steps += take_steps(robots, 1, width, height)
-        sf = safety_factor(robots, width // 2, height // 2)
-        if sf <= 84543414:
-            print(total_steps, sf)
-            print_grid(robots, width, height)
+    robots = parse(inputfile)
+
+    print(part1(robots, width, height))
+
+    tree_steps = part2(robots, width, height)
+    print(tree_steps)
 
-    print(safety_factor(robots, width // 2, height // 2))
+    print_grid(robots.moved(tree_steps, width, height), width, height)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-14")
     parser.add_argument("input", help="input data file")
     parser.add_argument("width", type=int, help="input data file")
     parser.add_argument("height", type=int, help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input, args.width, args.height)
+    run_profiled(args, main, args.input, args.width, args.height)
@@ -5,129 +5,129 @@ Advent of Code 2024-15
 """
 
 import argparse
+import sys
 import time
 from dataclasses import dataclass
-
-ROBOT = "@"
-SMALL_BOX = "O"
-BOX_LEFT = "["
-BOX_RIGHT = "]"
-WALL = "#"
-EMPTY = "."
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import OUTSIDE, Grid # pylint: disable=wrong-import-position
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+ROBOT = ord("@")
+SMALL_BOX = ord("O")
+BOX_LEFT = ord("[")
+BOX_RIGHT = ord("]")
+WALL = ord("#")
+EMPTY = ord(".")
 N = "^"
 E = ">"
 S = "v"
 W = "<"
 
-@dataclass
+WIDE_CELLS = {
+    "@": "@.",
+    "O": "[]",
+    "#": "##",
+    ".": "..",
+}
+
+@dataclass(slots=True)
 class Box:
-    row: int
     left: int
     right: int
 
 def widen_grid(grid):
-    wide_grid = []
-    for row in grid:
-        wide_row = []
-        wide_grid.append(wide_row)
-        for val in row:
-            if val == ROBOT:
-                new_cell = (ROBOT, EMPTY)
-            elif val == SMALL_BOX:
-                new_cell = (BOX_LEFT, BOX_RIGHT)
-            elif val == WALL:
-                new_cell = (WALL, WALL)
-            elif val == EMPTY:
-                new_cell = (EMPTY, EMPTY)
-            else:
+    wide_lines = []
+    for line in grid.lines():
+        wide_line = []
+        for val in line:
+            if val not in WIDE_CELLS:
                 raise ValueError(f"Unknown cell value: {val}")
+            wide_line.append(WIDE_CELLS[val])
+        wide_lines.append("".join(wide_line))
 
-            wide_row += [*new_cell]
-
-    return wide_grid
-
-def find_robot(grid):
-    for r, row in enumerate(grid):
-        for c, val in enumerate(row):
-            if val == ROBOT:
-                return r, c
-
-    raise ValueError("Robot not found!")
+    return Grid.from_lines(wide_lines)
 
-def get_step_for_direction(direction):
+def get_step_for_direction(grid, direction):
     if direction == N:
-        return -1, 0
+        return grid.offsets[0]
     if direction == E:
-        return 0, 1
+        return grid.offsets[1]
     if direction == S:
-        return 1, 0
+        return grid.offsets[2]
     if direction == W:
-        return 0, -1
+        return grid.offsets[3]
     raise ValueError(f"Illegal direction: {direction}")
 
-def walk_line_ahead(grid, r, c, direction):
-    rx, cx = get_step_for_direction(direction)
-    r += rx
-    c += cx
+def walk_line_ahead(grid, index, direction):
+    cells = grid.cells
+    step = get_step_for_direction(grid, direction)
+    index += step
 
-    while 0 <= r < len(grid) and 0 <= c < len(grid[0]):
-        yield r, c
-        r += rx
-        c += cx
+    while cells[index] != OUTSIDE:
+        yield index
+        index += step
 
-def can_move(grid, r, c, direction):
-    for r_ahead, c_ahead in walk_line_ahead(grid, r, c, direction):
-        cell = grid[r_ahead][c_ahead]
+def can_move(grid, index, direction):
+    cells = grid.cells
+    for ahead in walk_line_ahead(grid, index, direction):
+        cell = cells[ahead]
         if cell == WALL:
             return False
         if cell == EMPTY:
             return True
         if direction in [N, S]:
             if cell == BOX_LEFT:
-                if not can_move(grid, r_ahead, c_ahead + 1, direction):
+                if not can_move(grid, ahead + 1, direction):
                     return False
             if cell == BOX_RIGHT:
-                if not can_move(grid, r_ahead, c_ahead - 1, direction):
+                if not can_move(grid, ahead - 1, direction):
                     return False
     return False
 
 
-def shift_boxes_ew(grid, r, c, cx):
+def shift_boxes_ew(grid, index, step):
+    cells = grid.cells
     last_box = -1
-    moving_w = cx < 0
-    for c_ahead in range(c, 0 if moving_w else len(grid[0]), -1 if moving_w else 1):
-        if grid[r][c_ahead] in [BOX_LEFT, BOX_RIGHT]:
-            last_box = c_ahead
-        else:
-            break
+    moving_w = step < 0
+    ahead = index
+    while cells[ahead] in [BOX_LEFT, BOX_RIGHT]:
+        last_box = ahead
+        ahead += step
 
     if last_box != -1:
-        for c_ahead in range(last_box, c, 2 if moving_w else -2):
-            if cx < 0:
-                grid[r][c_ahead - 1] = BOX_LEFT
-                grid[r][c_ahead] = BOX_RIGHT
+        for ahead in range(last_box, index, 2 if moving_w else -2):
+            if moving_w:
+                cells[ahead - 1] = BOX_LEFT
+                cells[ahead] = BOX_RIGHT
             else:
-                grid[r][c_ahead + 1] = BOX_RIGHT
-                grid[r][c_ahead] = BOX_LEFT
+                cells[ahead + 1] = BOX_RIGHT
+                cells[ahead] = BOX_LEFT
         return True
     return False
 
-def find_boxes_in_row(grid, row, left, right):
+def find_boxes_in_row(grid, left, right):
+    cells = grid.cells
     box_lists = []
     current_list = []
 
-    col = left
+    index = left
     blank_spaces = 0
-    while col <= right:
+    while index <= right:
         if blank_spaces == 2 and len(current_list) > 0:
             box_lists.append(current_list)
             current_list = []
-        if grid[row][col] == BOX_LEFT:
-            current_list.append(Box(row, col, col + 1))
-            col += 2
+        if cells[index] == BOX_LEFT:
+            current_list.append(Box(index, index + 1))
+            index += 2
             blank_spaces = 0
         else:
-            col += 1
+            index += 1
             blank_spaces += 1
 
     if len(current_list) > 0:
@@ -135,96 +135,107 @@ def find_boxes_in_row(grid, row, left, right):
 
     return box_lists
 
-def shift_box_list_ns(grid, box_list, rx):
-    # print(f"shifting: {box_list}, {rx}")
-    current_row = box_list[0].row
+def shift_box_list_ns(grid, box_list, step):
+    # print(f"shifting: {box_list}, {step}")
+    cells = grid.cells
     current_left_edge = box_list[0].left
     current_right_edge = box_list[-1].right
 
-    next_row = current_row + rx
-    next_left_edge = current_left_edge
-    next_right_edge = current_right_edge
-    if grid[next_row][current_left_edge] == BOX_RIGHT:
+    next_left_edge = current_left_edge + step
+    next_right_edge = current_right_edge + step
+    if cells[next_left_edge] == BOX_RIGHT:
         next_left_edge -= 1
-    if grid[next_row][current_right_edge] == BOX_LEFT:
+    if cells[next_right_edge] == BOX_LEFT:
         next_right_edge += 1
 
-    next_box_lists = find_boxes_in_row(grid, next_row, next_left_edge, next_right_edge)
+    next_box_lists = find_boxes_in_row(grid, next_left_edge, next_right_edge)
     if len(next_box_lists) > 0:
         for current_list in next_box_lists:
-            shift_box_list_ns(grid, current_list, rx)
+            shift_box_list_ns(grid, current_list, step)
 
-    for col in range(current_left_edge, current_right_edge + 1):
-        # print(f"moving {current_row},{col} to {next_row},{col}")
-        grid[next_row][col] = grid[current_row][col]
-        grid[current_row][col] = EMPTY
+    for index in range(current_left_edge, current_right_edge + 1):
+        # print(f"moving {grid.position(index)} to {grid.position(index + step)}")
+        cells[index + step] = cells[index]
+        cells[index] = EMPTY
 
-def shift_boxes_ns(grid, r, c, rx):
-    cell = grid[r][c]
+def shift_boxes_ns(grid, index, step):
+    cells = grid.cells
+    cell = cells[index]
     if cell == BOX_LEFT:
-        shift_box_list_ns(grid, [Box(r, c, c + 1)], rx)
-        grid[r][c + 1] = EMPTY
+        shift_box_list_ns(grid, [Box(index, index + 1)], step)
+        cells[index + 1] = EMPTY
         return True
     if cell == BOX_RIGHT:
-        shift_box_list_ns(grid, [Box(r, c - 1, c)], rx)
-        grid[r][c - 1] = EMPTY
+        shift_box_list_ns(grid, [Box(index - 1, index)], step)
+        cells[index - 1] = EMPTY
         return True
     return False
 
-def shift_boxes(grid, r, c, rx, cx):
-    if cx != 0:
-        return shift_boxes_ew(grid, r, c, cx)
-    return shift_boxes_ns(grid, r, c, rx)
-
-def do_move(grid, r, c, direction):
-    grid[r][c] = EMPTY
-
-    rx, cx = get_step_for_direction(direction)
-    r += rx
-    c += cx
-    shifted = shift_boxes(grid, r, c, rx, cx)
-
-    grid[r][c] = ROBOT
-    return r, c, shifted
-
-def move_robot(grid, r, c, direction):
-    if can_move(grid, r, c, direction):
-        return do_move(grid, r, c, direction)
-    return r, c, True
+def shift_small_boxes(grid, index, step):
+    # the robot takes the first box's place, so the line just needs one more box on the end
+    cells = grid.cells
+    while cells[index] == SMALL_BOX:
+        index += step
+    cells[index] = SMALL_BOX
+    return True
+
+def shift_boxes(grid, index, step):
+    if grid.cells[index] == SMALL_BOX:
+        return shift_small_boxes(grid, index, step)
+    if step in (1, -1):
+        return shift_boxes_ew(grid, index, step)
+    return shift_boxes_ns(grid, index, step)
+
+def do_move(grid, index, direction):
+    cells = grid.cells
+    cells[index] = EMPTY
+
+    step = get_step_for_direction(grid, direction)
+    index += step
+    shifted = shift_boxes(grid, index, step)
+
+    cells[index] = ROBOT
+    return index, shifted
+
+def move_robot(grid, index, direction):
+    if can_move(grid, index, direction):
+        return do_move(grid, index, direction)
+    return index, True
 
 def print_grid(grid):
-    for row in grid:
-        print("".join(row))
+    for line in grid.lines():
+        print(line)
 
-def print_grid_segment(grid, r, c, direction, replace_robot_with_direction):
+def print_grid_segment(grid, index, direction, replace_robot_with_direction):
     buffer = 7
+    r, c = grid.position(index)
+    lines = list(grid.lines())
     # print(f"r: {r}")
-    for current_r in range(max(0, r - buffer), min(r + buffer + 1, len(grid))):
+    for current_r in range(max(0, r - buffer), min(r + buffer + 1, grid.height)):
         c_min = max(0, c - buffer * 2)
-        c_max = min(c + buffer * 2 + 1, len(grid[0]))
-        cells = grid[current_r][c_min:c_max]
+        c_max = min(c + buffer * 2 + 1, grid.width)
+        cells = list(lines[current_r][c_min:c_max])
         if replace_robot_with_direction and current_r == r:
             cells[buffer * 2] = direction
         print("".join(cells))
 
-def calc_gps(grid):
+def calc_gps(grid, box=BOX_LEFT):
     gps = 0
-    for r, row in enumerate(grid):
-        for c, val in enumerate(row):
-            if val == BOX_LEFT:
-                gps += 100 * r + c
+    for index in grid.find_all(box):
+        r, c = grid.position(index)
+        gps += 100 * r + c
 
     return gps
 
-def animate(grid, r, c, direction, last_direction, interesting, step):
+def animate(grid, index, direction, last_direction, interesting, step):
     # clear the screen
     if not 3104 <= step <= 3106:
         print("\033[2J\033[H", end="")
-    print_grid_segment(grid, r, c, last_direction, True)
+    print_grid_segment(grid, index, last_direction, True)
     # print("")
     # print_grid_segment(grid, 11, 45, last_direction, False)
     print(f"next move is {direction} step {step}")
-    print(f"current position is {r},{c}")
+    print(f"current position is {grid.position(index)}")
     if step > 4930:
         if 1898 <= step < 1905:
             time.sleep(4)
@@ -239,34 +250,53 @@ def animate(grid, r, c, direction, last_direction, interesting, step):
         else:
             time.sleep(0.01)
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        first, second = file.read().split("\n\n")
-        grid = [list(line.strip()) for line in first.split()]
-        moves = "".join(second.split())
+def parse(source):
+    with MappedInput(source) as puzzle:
+        first, second = puzzle.text_blocks()
+    grid = Grid.from_lines(first.split())
+    moves = "".join(second.split())
 
-    grid = widen_grid(grid)
-    # print_grid(grid)
-    r, c = find_robot(grid)
+    return grid, moves
+
+def run_robot(grid, moves):
+    index = grid.find(ROBOT)
 
     interesting = False
     step = 0
     last_direction = "@"
     for direction in moves:
-        # animate(grid, r, c, direction, last_direction, interesting, step)
+        # animate(grid, index, direction, last_direction, interesting, step)
 
-        r, c, interesting = move_robot(grid, r, c, direction)
+        index, interesting = move_robot(grid, index, direction)
 
         last_direction = direction
         step += 1
 
-    print_grid(grid)
+    # print_grid(grid)
+
+def part1(parsed):
+    grid, moves = parsed
+    grid = grid.copy()
+    run_robot(grid, moves)
+    return calc_gps(grid, SMALL_BOX)
+
+def part2(parsed):
+    grid, moves = parsed
+    grid = widen_grid(grid)
+    # print_grid(grid)
+    run_robot(grid, moves)
+    return calc_gps(grid)
+
+def main(inputfile):
+    parsed = parse(inputfile)
 
-    print(calc_gps(grid))
+    print(part1(parsed))
+    print(part2(parsed))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-15")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
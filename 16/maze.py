@@ -5,94 +5,98 @@ Advent of Code 2024-16
 """
 
 import argparse
-import heapq
-from collections import defaultdict
-
-OFFSETS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-DIRECTIONS = ["N", "E", "S", "W"]
-
-def debug(position, message):
-    if False and position[0] == 1:
-        print(message)
-
-def neighbors(grid, position):
-    for i, (dr, dc) in enumerate(OFFSETS):
-        nr, nc = position[0] + dr, position[1] + dc
-        if grid[nr][nc] != "#":
-            yield (nr, nc, DIRECTIONS[i])
-
-# A* search courtesy of ChatGPT
-def find_all_paths(grid, start_position, start_direction):
-    heap = [(0, start_position, start_direction, [start_position])]
-    visited = defaultdict(lambda: float('inf'))
-    min_cost = float('inf')
-
-    while heap:
-        cost, position, direction, path = heapq.heappop(heap)
-
-        if cost > min_cost:
-            continue
-
-        val = grid[position[0]][position[1]]
-        debug(position, f"Evaluating position {position} at {cost} with value {val}")
-        if val == "E":
-            debug(position, "found the end")
-            if cost < min_cost:
-                min_cost = cost
-                yield (cost, path)
-            elif cost == min_cost:
-                yield (cost, path)
-            else:
-                continue
-
-        if visited[(position, direction)] < cost:
-            continue
-        visited[(position, direction)] = cost
-
-        for neighbor in neighbors(grid, position):
-            new_position, new_direction = neighbor[:2], neighbor[2]
-            if direction != new_direction:
-                new_cost = cost + 1001
-            else:
-                new_cost = cost + 1
-
-            debug(position, f"pushing {new_position} heading {new_direction} at {new_cost} onto heap")
-            heapq.heappush(
-                heap,
-                (new_cost, new_position, new_direction, path + [new_position])
-            )
-
-def find_all_cheapest_paths(grid, start_position, start_direction):
-    paths = defaultdict(lambda: [])
-    for cost, path in find_all_paths(grid, start_position, start_direction):
-        paths[cost].append(path)
-
-    all_nodes = set()
-    min_cost = min(list(paths))
-    print(f"min cost is {min_cost} with {len(paths[min_cost])} paths")
-    for path in paths[min_cost]:
-        all_nodes.update(path)
-    return len(all_nodes)
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+from aoc.search import UNREACHED, dijkstra, on_cheapest_paths # pylint: disable=wrong-import-position
+
+# a state is position * 4 + direction, with directions in the same order as grid.offsets
+EAST = 1
+WALL = ord("#")
+END = ord("E")
+TURN = 1000
+
+def moves(grid):
+    cells = grid.cells
+    offsets = grid.offsets
+
+    def edges(state):
+        position, direction = divmod(state, 4)
+        for new_direction, offset in enumerate(offsets):
+            neighbor = position + offset
+            if cells[neighbor] != WALL:
+                yield neighbor * 4 + new_direction, 1 if new_direction == direction else TURN + 1
+
+    return edges
+
+def moves_back(grid):
+    """
+    the moves that lead into a state, for searching backwards from the end
+    """
+    cells = grid.cells
+    offsets = grid.offsets
+
+    def edges(state):
+        position, direction = divmod(state, 4)
+        previous = position - offsets[direction]
+        if cells[previous] != WALL:
+            for old_direction in range(4):
+                yield previous * 4 + old_direction, 1 if old_direction == direction else TURN + 1
+
+    return edges
+
+def end_states(grid):
+    end = grid.find(END)
+    return [end * 4 + direction for direction in range(4)]
+
+def cheapest(grid, start_state):
+    dist = dijkstra(len(grid) * 4, [start_state], moves(grid))
+    return dist, min(dist[state] for state in end_states(grid) if dist[state] != UNREACHED)
+
+def find_all_cheapest_paths(grid, start_state):
+    forward, best = cheapest(grid, start_state)
+    backward = dijkstra(len(grid) * 4, end_states(grid), moves_back(grid), limit=best)
+    return len({state // 4 for state in on_cheapest_paths(forward, backward, best)})
 
 def print_path(grid, path):
-    for r, row in enumerate(grid):
+    for r, row in enumerate(grid.lines()):
         rowstr = []
         for c, val in enumerate(row):
-            if (r, c) in path:
+            if grid.index(r, c) in path:
                 val = "*"
             rowstr.append(val)
         print("".join(rowstr))
 
+def parse(source):
+    return Grid.parse(read_text(source))
+
+def start_of(grid):
+    return grid.index(grid.height - 2, 1) * 4 + EAST
+
+def part1(grid):
+    _, best = cheapest(grid, start_of(grid))
+    return best
+
+def part2(grid):
+    return find_all_cheapest_paths(grid, start_of(grid))
+
 def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+    grid = parse(inputfile)
 
-    cost = find_all_cheapest_paths(grid, (len(grid) - 2, 1), "E")
-    print(cost)
+    print(part1(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-16")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
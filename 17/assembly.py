@@ -5,9 +5,19 @@ Advent of Code 2024-17
 """
 
 import argparse
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
-@dataclass
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc import counters # pylint: disable=wrong-import-position
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+@dataclass(slots=True)
 class Machine:
     a: int
     b: int
@@ -79,15 +89,23 @@ class Machine:
             self.ip += 2
 
     def execute(self):
+        steps = 0
         while self.ip < len(self.tape) - 1:
             # print(self)
             self.instruction()
+            steps += 1
+        counters.count("17/instructions", steps)
 
     def execute_until_first_output(self):
-        while self.ip < len(self.tape) - 1:
-            self.instruction()
-            if len(self.output) > 0:
-                return self.output[0]
+        steps = 0
+        try:
+            while self.ip < len(self.tape) - 1:
+                self.instruction()
+                steps += 1
+                if len(self.output) > 0:
+                    return self.output[0]
+        finally:
+            counters.count("17/instructions", steps)
         raise ValueError("Program terminated before generating output!")
 
 def extract_register_value(line):
@@ -117,36 +135,49 @@ def find_magic_value(template_machine, start, goals):
 
     return None
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        registers, program = file.read().split("\n\n")
+def parse(source):
+    with MappedInput(source) as puzzle:
+        registers, program = puzzle.text_blocks()
 
-        a, b, c = registers.split("\n")
-        a = extract_register_value(a)
-        b = extract_register_value(b)
-        c = extract_register_value(c)
+    a, b, c = registers.split("\n")
+    a = extract_register_value(a)
+    b = extract_register_value(b)
+    c = extract_register_value(c)
 
-        _, right = program.split(":")
-        tape = [int(val) for val in right.strip().split(",")]
+    _, right = program.split(":")
+    tape = [int(val) for val in right.strip().split(",")]
 
-        # machine = Machine(a, b, c, tape, 0, [])
+    return Machine(a, b, c, tape, 0, [])
 
-    template_machine = Machine(a, b, c, tape, 0, [])
-    goals = list(reversed(tape))
-    found_value = find_magic_value(template_machine, 1, goals)
-
-    print(f"found value {found_value}, trying it...")
-    machine = Machine(found_value, b, c, tape, 0, [])
+def part1(template_machine):
+    machine = Machine(
+        template_machine.a,
+        template_machine.b,
+        template_machine.c,
+        template_machine.tape,
+        0,
+        []
+    )
     machine.execute()
-    print(tape)
-    print(machine.output)
+    return ",".join(str(val) for val in machine.output)
+
+def part2(template_machine):
+    goals = list(reversed(template_machine.tape))
+    return find_magic_value(template_machine, 1, goals)
+
+def main(inputfile):
+    template_machine = parse(inputfile)
+
+    print(part1(template_machine))
+    print(part2(template_machine))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-17")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
 
 
 """
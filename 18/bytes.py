@@ -5,59 +5,75 @@ Advent of Code 2024-18
 """
 
 import argparse
-from collections import deque
+import sys
+from pathlib import Path
 
-directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-def find_shortest_path(rows, cols, walls):
-    queue = deque([(0, 0, 0)])
-    visited = set()
-    visited.add((0, 0))
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.integers import iter_integers # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+from aoc.search import bfs # pylint: disable=wrong-import-position
+
+WALL = ord("#")
 
-    while queue:
-        r, c, dist = queue.popleft()
-        if r == rows - 1 and c == cols - 1:
-            return dist
+def build_grid(rows, cols, walls):
+    grid = Grid(cols, rows)
+    for r, c in walls:
+        grid.cells[grid.index(r, c)] = WALL
+    return grid
+
+def find_shortest_path(rows, cols, walls):
+    grid = build_grid(rows, cols, walls)
+    end = grid.index(rows - 1, cols - 1)
+    cells = grid.cells
 
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols:
-                new_spot = (nr, nc)
-                if new_spot not in walls and new_spot not in visited:
-                    visited.add(new_spot)
-                    queue.append((nr, nc, dist + 1))
+    def neighbors(index):
+        return (neighbor for neighbor in grid.neighbors(index) if cells[neighbor] != WALL)
 
-    return -1
+    # UNREACHED is -1, which is what zoom_into_answer looks for
+    return bfs(len(grid), [grid.index(0, 0)], neighbors, target=end)[end]
 
 def zoom_into_answer(width, height, byte_coords, start, stop, step):
-    print(f"zooming from {start} to {stop} step {step}")
+    # print(f"zooming from {start} to {stop} step {step}")
     for time in range(start, stop, step):
-        print(f"trying {time}")
+        # print(f"trying {time}")
         if find_shortest_path(width, height, byte_coords[0:time]) == -1:
-            print("blocked")
+            # print("blocked")
             if step == 1:
                 return time
             return zoom_into_answer(width, height, byte_coords, time - step, time + 1, step // 10)
 
     return zoom_into_answer(width, height, byte_coords, time, len(byte_coords), step // 10)
 
-def main(inputfile, width, height):
-    byte_coords = []
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        for line in file:
-            x, y = line.split(",")
-            byte_coords.append((int(y), int(x))) # swap x and y for r and c
-    # print(byte_coords)
+def parse(source):
+    values = iter_integers(source)
+    # swap x and y for r and c
+    return [(y, x) for x, y in zip(values, values)]
 
+def part1(byte_coords, width=71, height=71, fallen=1024):
+    return find_shortest_path(width, height, byte_coords[0:fallen])
+
+def part2(byte_coords, width=71, height=71):
     answer = zoom_into_answer(width, height, byte_coords, 0, len(byte_coords), 1000)
     r, c = byte_coords[answer - 1]
-    print(f"{c},{r}") # switch back to x,y
+    return f"{c},{r}" # switch back to x,y
+
+def main(inputfile, width, height, fallen=1024):
+    byte_coords = parse(inputfile)
+
+    print(part1(byte_coords, width, height, fallen))
+    print(part2(byte_coords, width, height))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-18")
     parser.add_argument("input", help="input data file")
     parser.add_argument("width", type=int, help="input data file")
     parser.add_argument("height", type=int, help="input data file")
+    parser.add_argument("--fallen", type=int, default=1024, help="bytes fallen for part 1")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input, args.width, args.height)
+    run_profiled(args, main, args.input, args.width, args.height, args.fallen)
@@ -5,43 +5,65 @@ Advent of Code 2024-19
 """
 
 import argparse
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.memo import Memo # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 def count_ways(pattern, towels, cache):
     if len(pattern) == 0:
         return 1
 
-    if pattern in cache:
-        return cache[pattern]
+    ways = cache.get(pattern)
+    if ways is not None:
+        return ways
 
+    # remember the dead ends too, or an impossible design gets retried over and over
     ways = 0
     for towel in towels:
         if pattern.startswith(towel):
-            new_start = len(towel)
-            sub_pattern = pattern[new_start:]
-            new_ways = count_ways(sub_pattern, towels, cache)
-            if new_ways > 0:
-                cache[sub_pattern] = new_ways
-                ways += new_ways
+            ways += count_ways(pattern[len(towel):], towels, cache)
 
+    cache[pattern] = ways
     return ways
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        towels, patterns = file.read().split("\n\n")
-        towels = [towel.strip() for towel in towels.split(",")]
-        patterns = patterns.strip().split("\n")
+def parse(source):
+    with MappedInput(source) as puzzle:
+        towels, patterns = puzzle.text_blocks()
+    towels = [towel.strip() for towel in towels.split(",")]
+    patterns = patterns.strip().split("\n")
 
-    ways = 0
-    cache = {}
+    return towels, patterns
+
+def all_ways(parsed):
+    towels, patterns = parsed
+    cache = Memo("19/ways")
     for pattern in patterns:
         # print(f"testing {pattern}")
-        ways += count_ways(pattern, towels, cache)
+        yield count_ways(pattern, towels, cache)
+
+def part1(parsed):
+    return sum(1 for ways in all_ways(parsed) if ways > 0)
+
+def part2(parsed):
+    return sum(all_ways(parsed))
+
+def main(inputfile):
+    parsed = parse(inputfile)
 
-    print(ways)
+    print(part1(parsed))
+    print(part2(parsed))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-19")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,103 +5,98 @@ Advent of Code 2024-20
 """
 
 import argparse
-from dataclasses import dataclass
-from collections import deque
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.grid import Grid # pylint: disable=wrong-import-position
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+from aoc.search import UNREACHED, bfs # pylint: disable=wrong-import-position
 
 START = "S"
-END = "E"
-WALL = "#"
-EMPTY = "."
-
-STEPS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-@dataclass
-class Cell:
-    r: int
-    c: int
-    val: str
-    dist: int
-    grid: list
-
-def convert_grid(grid):
-    start = None
-    for r, row in enumerate(grid):
-        for c, val in enumerate(row):
-            cell = Cell(r, c, val, -1, grid)
-            grid[r][c] = cell
-            if val == START:
-                start = cell
-
-    return start
-
-def neighbors(grid, cell, dist):
-    for new_r in range(cell.r - dist, cell.r + dist + 1):
-        remainder = dist - abs(cell.r - new_r)
-        for new_c in range(cell.c - remainder, cell.c + remainder + 1):
-            if 0 <= new_r < len(grid) and 0 <= new_c < len(grid[0]):
-                neighbor = grid[new_r][new_c]
-                if neighbor.val != WALL:
-                    yield neighbor
+WALL = ord("#")
+EMPTY = ord(".")
+
+# the longest cheat either part takes, which is how far past the edge a jump can land
+MAX_CHEAT = 20
+
+def jumps_within(grid, cheat_length):
+    """
+    the offset of every cell within `cheat_length` steps, along with how many steps it is
+    """
+    jumps = []
+    for dr in range(-cheat_length, cheat_length + 1):
+        remainder = cheat_length - abs(dr)
+        for dc in range(-remainder, remainder + 1):
+            jumps.append((dr * grid.stride + dc, abs(dr) + abs(dc)))
+    return jumps
 
 def map_distances(grid, start):
-    queue = deque([start])
-    visited = set()
-    visited.add((start.r, start.c))
-    start.dist = 0
-
-    path = []
-    while queue:
-        current_cell = queue.popleft()
-        path.append(current_cell)
-        for neighbor in neighbors(grid, current_cell, 1):
-            position = (neighbor.r, neighbor.c)
-            if position not in visited:
-                visited.add(position)
-                neighbor.dist = current_cell.dist + 1
-                queue.append(neighbor)
-
-    return path
-
-def print_grid(grid):
-    for row in grid:
+    # distance from the start for every index; walls and the border stay UNREACHED (-1)
+    cells = grid.cells
+
+    def neighbors(index):
+        return (neighbor for neighbor in grid.neighbors(index) if cells[neighbor] != WALL)
+
+    dist = bfs(len(grid), [start], neighbors)
+    path = [index for index, distance in enumerate(dist) if distance != UNREACHED]
+    return path, dist
+
+def print_grid(grid, dist):
+    for r in range(grid.height):
         printable = []
-        for cell in row:
-            if cell.val == EMPTY:
-                printable.append(f"{cell.dist:<2}")
+        for c in range(grid.width):
+            index = grid.index(r, c)
+            if grid.cells[index] == EMPTY:
+                printable.append(f"{dist[index]:<2}")
             else:
-                printable.append(cell.val)
+                printable.append(chr(grid.cells[index]))
                 printable.append(" ")
         print("".join(printable))
 
-def find_shortcuts(grid, path, min_savings):
-    shortcuts = set()
-    for current_cell in path:
-        for jump in neighbors(grid, current_cell, 20):
-            shortcut_length = abs(jump.r - current_cell.r) + abs(jump.c - current_cell.c)
-            if jump.dist - current_cell.dist - shortcut_length >= min_savings:
-                shortcuts.add((current_cell.r, current_cell.c, jump.r, jump.c))
+def find_shortcuts(grid, path, dist, min_savings, cheat_length):
+    jumps = jumps_within(grid, cheat_length)
+    shortcuts = 0
+    for index in path:
+        # anything not on the track is -1, so it never saves enough
+        needed = dist[index] + min_savings
+        for offset, shortcut_length in jumps:
+            if dist[index + offset] - shortcut_length >= needed:
+                shortcuts += 1
 
     return shortcuts
 
-def main(inputfile, min_savings):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
-    # print(grid)
+def parse(source):
+    return Grid.parse(read_text(source), pad=MAX_CHEAT)
 
-    start = convert_grid(grid)
-    path = map_distances(grid, start)
-    # print_grid(grid)
+def count_shortcuts(grid, min_savings, cheat_length):
+    path, dist = map_distances(grid, grid.find(START))
+    # print_grid(grid, dist)
     # print(len(path))
 
-    shortcuts = find_shortcuts(grid, path, min_savings)
-    # print(shortcuts)
-    print(len(shortcuts))
+    return find_shortcuts(grid, path, dist, min_savings, cheat_length)
+
+def part1(grid, min_savings=100):
+    return count_shortcuts(grid, min_savings, 2)
+
+def part2(grid, min_savings=100):
+    return count_shortcuts(grid, min_savings, 20)
+
+def main(inputfile, min_savings):
+    grid = parse(inputfile)
 
+    print(part1(grid, min_savings))
+    print(part2(grid, min_savings))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-20")
     parser.add_argument("input", help="input data file")
     parser.add_argument("min_savings", type=int, help="minimum shortcut to count")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input, args.min_savings)
+    run_profiled(args, main, args.input, args.min_savings)
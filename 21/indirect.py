@@ -5,6 +5,16 @@ Advent of Code 2024-21
 """
 
 import argparse
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.memo import Memo # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 nkp = {
     "7": (0, 0), "8": (0, 1), "9": (0, 2),
@@ -21,11 +31,12 @@ dkp = {
 def add_path(dd, neg, pos):
     return (neg if dd < 0 else pos) * abs(dd)
 
-path_cache = {}
+path_cache = Memo("21/paths")
 def get_path_between(start_char, end_char, keypad):
     cache_key = (start_char, end_char, "d" if keypad == dkp else "n")
-    if cache_key in path_cache:
-        return path_cache[cache_key]
+    path = path_cache.get(cache_key)
+    if path is not None:
+        return path
 
     start_pos = keypad[start_char]
     end_pos = keypad[end_char]
@@ -63,14 +74,15 @@ def get_path_between(start_char, end_char, keypad):
     # print(f"path_cache size: {len(path_cache)}")
     return path
 
-length_cache = {}
+length_cache = Memo("21/lengths")
 def get_final_length(code, keypads):
     if len(keypads) == 0:
         return len(code)
 
     cache_key = (code, len(keypads))
-    if cache_key in length_cache:
-        return length_cache[cache_key]
+    final_length = length_cache.get(cache_key)
+    if final_length is not None:
+        return final_length
 
     # print(f"evaluating {code} with {len(keypads)} keypads")
 
@@ -86,26 +98,41 @@ def get_final_length(code, keypads):
     # print(f"length_cache size: {len(length_cache)}")
     return final_length
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        codes = [line.strip() for line in file]
+def parse(source):
+    codes = [line.strip() for line in read_text(source).splitlines()]
     # print(codes)
 
+    return codes
+
+def total_complexity(codes, robots):
     keypads = [nkp]
-    for _ in range(25):
+    for _ in range(robots):
         keypads.append(dkp)
 
     complexity = 0
     for code in codes:
         final_length = get_final_length(code, keypads)
-        print(final_length, int(code[0:-1]))
+        # print(final_length, int(code[0:-1]))
         complexity += final_length * int(code[0:-1])
-        print()
-    print(complexity)
+
+    return complexity
+
+def part1(codes):
+    return total_complexity(codes, 2)
+
+def part2(codes):
+    return total_complexity(codes, 25)
+
+def main(inputfile):
+    codes = parse(inputfile)
+
+    print(part1(codes))
+    print(part2(codes))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-21")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,70 +5,89 @@ Advent of Code 2024-22
 """
 
 import argparse
+import sys
+from array import array
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.integers import iter_integers # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 SEQ_LEN = 4
+# every run of SEQ_LEN price changes, each from -9 to 9, packed into one int
+SEQUENCES = 19 ** SEQ_LEN
 
 def prune_mix(secret, modified):
     return (modified ^ secret) % 16777216
 
-def append(secret, last_price, deltas, only_first_sequences, all_sequences):
+def next_secret(secret):
+    secret = prune_mix(secret * 64, secret)
+    secret = prune_mix(secret // 32, secret)
+    secret = prune_mix(secret * 2048, secret)
+    return secret
+
+def new_sequence_tables():
+    """
+    the price totals for each sequence, and which buyer (counting from 1) saw each
+    sequence last; this is all part 2 keeps, however many buyers there are
+    """
+    return [0] * SEQUENCES, array('l', [0]) * SEQUENCES
+
+def iterate(secret, count, totals, seen, buyer):
+    """
+    add the price at the first sighting of each sequence to its total,
+    and return the last secret
+    """
     price = secret % 10
+    sequence = 0
+    for step in range(1, count + 1):
+        secret = next_secret(secret)
+        new_price = secret % 10
+        sequence = (sequence * 19 + new_price - price + 9) % SEQUENCES
+        price = new_price
 
-    if last_price is not None:
-        deltas.append(price - last_price)
-    else:
-        deltas.append(None)
-
-    if len(deltas) > SEQ_LEN:
-        sequence = tuple(deltas[-SEQ_LEN:])
-        if sequence not in only_first_sequences:
-            only_first_sequences.add(sequence)
+        if step >= SEQ_LEN and seen[sequence] != buyer:
+            seen[sequence] = buyer
+            totals[sequence] += price
 
-            if sequence not in all_sequences:
-                all_sequences[sequence] = price
-            else:
-                all_sequences[sequence] += price
+    return secret
 
-    return price
+def parse(source):
+    return list(iter_integers(source))
 
-def iterate(secret, count, all_sequences):
-    deltas = []
-    only_first_sequences = set()
+def part1(buyer_seeds):
+    total = 0
+    for secret in buyer_seeds:
+        for _ in range(2000):
+            secret = next_secret(secret)
+        total += secret
 
-    last_price = append(secret, None, deltas, only_first_sequences, all_sequences)
-    for _ in range(count):
-        secret = prune_mix(secret * 64, secret)
-        secret = prune_mix(secret // 32, secret)
-        secret = prune_mix(secret * 2048, secret)
+    return total
 
-        last_price = append(secret, last_price, deltas, only_first_sequences, all_sequences)
+def part2(buyer_seeds):
+    totals, seen = new_sequence_tables()
+    for buyer, seed in enumerate(buyer_seeds, 1):
+        iterate(seed, 2000, totals, seen, buyer)
 
-def find_optimal_sequence(all_sequences):
-    max_price = 0
-    best_sequence = None
-    for sequence, price in all_sequences.items():
-        if price > max_price:
-            print(f"new max price: {price} with sequence {sequence}")
-            max_price = price
-            best_sequence = sequence
-
-    return best_sequence, max_price
+    return max(totals)
 
 def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        buyer_seeds = [int(line.strip()) for line in file]
-
-    all_sequences = {}
-    for seed in buyer_seeds:
-        iterate(seed, 2000, all_sequences)
+    # both parts in one pass over the buyers, holding one at a time
+    total = 0
+    totals, seen = new_sequence_tables()
+    for buyer, seed in enumerate(iter_integers(inputfile), 1):
+        total += iterate(seed, 2000, totals, seen, buyer)
 
-    sequence, total = find_optimal_sequence(all_sequences)
-    print(sequence)
     print(total)
+    print(max(totals))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-22")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
@@ -5,9 +5,19 @@ Advent of Code 2024-23
 """
 
 import argparse
+import sys
 from dataclasses import dataclass
+from itertools import combinations
+from pathlib import Path
 
-@dataclass
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+@dataclass(slots=True)
 class Computer:
     name: str
     connected: dict
@@ -50,6 +60,15 @@ def add_fully_connected(candidates, groups, computers):
     fully_connected = find_fully_connected(candidates, computers)
     groups.add(tuple(fully_connected))
 
+def find_triangles(computers):
+    triangles = set()
+    for computer in computers.values():
+        for left, right in combinations(computer.connected.values(), 2):
+            if right.name in left.connected:
+                triangles.add(tuple(sorted((computer.name, left.name, right.name))))
+
+    return triangles
+
 def find_groups(computers):
     groups = set()
     for computer in computers.values():
@@ -59,12 +78,17 @@ def find_groups(computers):
 
     return groups
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        pairings = [line.strip() for line in file]
+def parse(source):
+    pairings = [line.strip() for line in read_text(source).splitlines()]
     # print(pairings)
 
-    computers = pair_up(pairings)
+    return pair_up(pairings)
+
+def part1(computers):
+    triangles = find_triangles(computers)
+    return sum(1 for triangle in triangles if any(name.startswith("t") for name in triangle))
+
+def part2(computers):
     groups = find_groups(computers)
 
     max_len = 0
@@ -74,13 +98,19 @@ def main(inputfile):
             max_len = len(group)
             longest_group = group
 
-    print(",".join(list(longest_group)))
     # print(len(groups))
+    return ",".join(list(longest_group))
+
+def main(inputfile):
+    computers = parse(inputfile)
 
+    print(part1(computers))
+    print(part2(computers))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-23")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
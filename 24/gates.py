@@ -5,11 +5,22 @@ Advent of Code 2024-24
 """
 
 import argparse
+import sys
 from dataclasses import dataclass
 from itertools import combinations
 from collections import deque
+from copy import deepcopy
+from pathlib import Path
 
-@dataclass
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc import counters # pylint: disable=wrong-import-position
+from aoc.inputs import MappedInput # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+@dataclass(slots=True)
 class Gate:
     in1: str
     in2: str
@@ -32,7 +43,7 @@ class Gate:
         self.value = tmp_val
 
 
-@dataclass
+@dataclass(slots=True)
 class Circuit:
     gates: dict
     inputs: dict
@@ -149,10 +160,10 @@ def generate_inputs(input_lines):
     inputs = {}
     max_x = 0
     for input_line in input_lines.split("\n"):
-        name, _ = input_line.split(":")
+        name, value = input_line.split(":")
         name = name.strip()
-        inputs[name] = 0
-        max_x = max(max_x, int(name[1:3]))
+        inputs[name] = int(value)
+        max_x = max(max_x, int(name[1:]))
 
     outputs = []
     for _ in range(max_x + 2):
@@ -197,6 +208,7 @@ def find_first_bad_bit(circuit, known_swaps):
     return -1
 
 def try_swap(test_swap, circuit, candidates, known_swaps, first_bad_bit):
+    counters.count("24/swaps tried")
     candidates = [candidate for candidate in candidates if candidate not in test_swap]
     known_swaps = list(known_swaps) + list(test_swap)
     return find_swaps(circuit, candidates, known_swaps, first_bad_bit)
@@ -268,19 +280,37 @@ def verify_result(circuit, swaps):
             return False
     return True
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        input_lines, gate_lines = file.read().split("\n\n")
+def parse(source):
+    with MappedInput(source) as puzzle:
+        input_lines, gate_lines = puzzle.text_blocks()
+
+    return make_circuit(input_lines, gate_lines)
 
-    circuit = make_circuit(input_lines, gate_lines)
+def part1(circuit):
+    # the z gates aren't always one more than the inputs, so go by name
+    circuit = deepcopy(circuit)
+    circuit.reset_signals()
+    z_names = sorted(name for name in circuit.gates if name.startswith("z"))
+    return to_decimal([circuit.calc_output(circuit.gates[name], [], True) for name in z_names])
+
+def part2(circuit):
+    # both the inputs and the gates get scribbled over while testing, so work on a copy
+    circuit = deepcopy(circuit)
     candidates = find_problem_gate_candidates(circuit)
 
     swaps = find_swaps(circuit, candidates, [], -1)
-    print(",".join(sorted(swaps)))
+    return ",".join(sorted(swaps))
+
+def main(inputfile):
+    circuit = parse(inputfile)
+
+    print(part1(circuit))
+    print(part2(circuit))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-24")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
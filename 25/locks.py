@@ -5,6 +5,16 @@ Advent of Code 2024-25
 """
 
 import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aoc.inputs import read_blocks # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
 
 def parse_lock(grid):
     heights = []
@@ -27,31 +37,41 @@ def is_compatible(lock, key):
 
 def count_compatible(locks, keys):
     compatible = 0
-    for lock in locks:
-        for key in keys:
+    for lock, lock_count in locks.items():
+        for key, key_count in keys.items():
             if is_compatible(lock, key):
-                compatible += 1
+                compatible += lock_count * key_count
     return compatible
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        blobs = file.read().split("\n\n")
-
-    locks = []
-    keys = []
-    for blob in blobs:
-        grid = [list(line.strip()) for line in blob.strip().split("\n")]
+def parse(source):
+    """
+    count the locks and keys of each shape; there can't be more shapes than there
+    are combinations of heights, however long the input is
+    """
+    locks = Counter()
+    keys = Counter()
+    for block in read_blocks(source):
+        grid = [list(line.strip()) for line in block]
         if "." in grid[0]:
-            keys.append(parse_key(grid))
+            keys[tuple(parse_key(grid))] += 1
         else:
-            locks.append(parse_lock(grid))
+            locks[tuple(parse_lock(grid))] += 1
+
+    return locks, keys
+
+def part1(parsed):
+    return count_compatible(*parsed)
+
+def main(inputfile):
+    parsed = parse(inputfile)
 
-    print(count_compatible(locks, keys))
+    print(part1(parsed))
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-25")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)
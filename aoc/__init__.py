@@ -0,0 +1,3 @@
+"""
+Shared helpers for the Advent of Code 2024 solvers
+"""
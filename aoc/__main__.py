@@ -0,0 +1,138 @@
+"""
+Run the daily solvers in one process, or keep them warm in a daemon
+
+    python -m aoc run                           # every day, over the *.txt files next to it
+    python -m aoc run 01..05 24 --pattern 'input*.txt'
+    python -m aoc run --cache                   # reuse answers from earlier runs
+    python -m aoc run 09 --engine fast          # a day's faster engine, where it has one
+    python -m aoc serve &                       # preload every day behind a Unix socket
+    python -m aoc ask 14 part1 14/test.txt --option width=11 --option height=7
+    python -m aoc batch 22 inputs/*.txt -j 16   # JSON lines, as each file finishes
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+
+from aoc.batch import run_batch
+from aoc.cache import DEFAULT_DIRECTORY, ResultCache
+from aoc.daemon import DEFAULT_SOCKET, ask, serve
+from aoc import counters, memo
+from aoc.days import select_days
+from aoc.engines import REFERENCE
+from aoc.runner import run_days
+
+def print_result(name, input_name, result, show_memos=False):
+    engine = f" [{result['engine']}]" if result.get("engine", REFERENCE) != REFERENCE else ""
+    print(f"{name} {input_name}{engine}")
+    for part, answer in result["answers"].items():
+        cached = ", cached" if part in result["cached"] else ""
+        print(f"  {part}: {answer}  ({result['timings'][part] * 1000:.1f} ms{cached})")
+    if "error" in result:
+        print(f"  {result['error']}")
+    for counter, value in result.get("counters", {}).items():
+        print(f"  count {counter}: {value}")
+    if show_memos:
+        for memo_name, stats in result["memos"].items():
+            summary = ", ".join(f"{counter} {value}" for counter, value in stats.items())
+            print(f"  memo {memo_name}: {summary}")
+
+def print_day_totals(results):
+    totals = defaultdict(float)
+    for (name, _), result in results.items():
+        totals[name[:2]] += sum(result["timings"].values())
+
+    print()
+    for day, total in totals.items():
+        print(f"{day} {total * 1000:10.1f} ms")
+    print(f"all {sum(totals.values()) * 1000:10.1f} ms")
+
+def parse_option(option):
+    name, _, value = option.partition("=")
+    return name, int(value) if value.lstrip("-").isdigit() else value
+
+def ask_daemon(args):
+    with open(args.input, 'rb') as file:
+        data = file.read()
+
+    reply = ask(args.day, args.part, data, dict(args.option), args.socket, args.engine)
+    if "error" in reply:
+        print(reply["error"], file=sys.stderr)
+        sys.exit(1)
+    print(f"{reply['answer']}  ({reply['seconds'] * 1000:.1f} ms)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Advent of Code 2024")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve days in this process")
+    run.add_argument("days", nargs="*", help="days to run, e.g. 06 or 01..25 (default: all)")
+    run.add_argument("--pattern", default="*.txt",
+                     help="input file glob (default: %(default)s)")
+    run.add_argument("--cache", nargs="?", const=DEFAULT_DIRECTORY, metavar="DIR",
+                     help="cache parsed inputs and answers on disk"
+                     f" (default: {DEFAULT_DIRECTORY})")
+    run.add_argument("--cache-size", type=int, default=256, metavar="MIB",
+                     help="cache size limit in MiB (default: %(default)s)")
+    run.add_argument("--memo-size", type=int, metavar="N", help="bound every memo to N entries")
+    run.add_argument("--memo-stats", action="store_true",
+                     help="print memo hits, misses and evictions")
+    run.add_argument("--counters", action="store_true",
+                     help="count and print the work each solver does")
+    run.add_argument("--engine", default=REFERENCE,
+                     help="run this engine wherever a day has it (default: %(default)s)")
+
+    daemon = commands.add_parser("serve", help="answer requests over a Unix socket")
+    daemon.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help="socket path (default: %(default)s)")
+    daemon.add_argument("--workers", type=int,
+                        help="processes for the heavy days (default: one per CPU)")
+
+    client = commands.add_parser("ask", help="send one input to a running daemon")
+    client.add_argument("day", help="the day to solve, e.g. 06")
+    client.add_argument("part", choices=("part1", "part2"), help="which part")
+    client.add_argument("input", help="input data file")
+    client.add_argument("--option", type=parse_option, action="append", default=[],
+                        help="extra part option, e.g. width=11 (repeatable)")
+    client.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help="socket path (default: %(default)s)")
+    client.add_argument("--engine", default=REFERENCE,
+                        help="which engine to run (default: %(default)s)")
+
+    batch = commands.add_parser("batch", help="solve one day for many inputs in parallel")
+    batch.add_argument("day", help="the day to solve, e.g. 22")
+    batch.add_argument("inputs", nargs="+", help="input data files")
+    batch.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    batch.add_argument("--option", type=parse_option, action="append", default=[],
+                       help="extra part option, e.g. width=11 (repeatable)")
+    batch.add_argument("--engine", default=REFERENCE,
+                       help="run this engine wherever the day has it (default: %(default)s)")
+
+    args = parser.parse_args()
+
+    if args.command == "batch":
+        days = select_days([args.day]) or []
+        if len(days) != 1:
+            parser.error(f"batch solves one day at a time, not {args.day!r}")
+        if run_batch(days[0], args.inputs, dict(args.option), args.jobs, engine=args.engine):
+            sys.exit(1)
+    elif args.command == "serve":
+        serve(args.socket, args.workers)
+    elif args.command == "ask":
+        ask_daemon(args)
+    else:
+        memo.default_maxsize = args.memo_size
+        if args.counters:
+            counters.enable()
+        cache = ResultCache(args.cache, args.cache_size * 1024 * 1024) if args.cache else None
+
+        def progress(name, input_name, result):
+            print_result(name, input_name, result, args.memo_stats)
+
+        results = run_days(select_days(args.days), args.pattern, progress, cache, args.engine)
+        print_day_totals(results)
+        if any("error" in result for result in results.values()):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
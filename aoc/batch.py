@@ -0,0 +1,58 @@
+"""
+Solve one day for many input files across a pool of processes
+
+Each worker imports the day's solver scripts once, then takes files one at a
+time.  Results come back as JSON lines in whatever order the files finish, and a
+file whose solver raises only fails itself.
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc.days import find_modules, load_module, module_name
+from aoc.engines import REFERENCE
+from aoc.runner import run_input
+
+_modules = []
+
+def load_day(day):
+    _modules.clear()
+    for module_path in find_modules([day]):
+        _modules.append((module_name(module_path), load_module(module_path)))
+
+def solve_file(input_path, options, engine=REFERENCE):
+    """
+    run each of the day's scripts over one file, in a worker
+    """
+    results = []
+    for name, module in _modules:
+        result = run_input(module, input_path, options, engine=engine)
+        result["module"] = name
+        results.append(result)
+    return results
+
+def run_batch(day, input_paths, options=None, jobs=None, output=sys.stdout, engine=REFERENCE):
+    """
+    write one JSON line per (file, script) to `output` as they finish;
+    returns how many of them failed
+    """
+    failures = 0
+    with ProcessPoolExecutor(jobs or os.cpu_count(), initializer=load_day, initargs=(day,)) as pool:
+        futures = {
+            pool.submit(solve_file, path, options or {}, engine): path for path in input_paths
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as error: # pylint: disable=broad-exception-caught
+                results = [{"error": f"{type(error).__name__}: {error}"}]
+
+            for result in results:
+                result["input"] = str(futures[future])
+                failures += "error" in result
+                output.write(json.dumps(result, default=str) + "\n")
+            output.flush()
+
+    return failures
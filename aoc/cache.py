@@ -0,0 +1,90 @@
+"""
+An on-disk cache of parsed inputs and answers
+
+Entries are keyed by the sha256 of the input bytes together with a hash of the
+solver's source (and of the shared aoc code it leans on), so editing a solver
+quietly invalidates everything it cached.  Entries are pickles; reading one
+touches it, and when the cache grows past its size limit the least recently used
+entries are dropped.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+from aoc.days import ROOT
+
+DEFAULT_DIRECTORY = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aoc2024"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+def solver_digest(module):
+    """
+    a hash of the solver script's source plus the shared code under aoc/
+    """
+    sha = hashlib.sha256(Path(module.__file__).read_bytes())
+    for path in sorted((ROOT / "aoc").glob("*.py")):
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(solver, input_digest, what, options=None):
+        """
+        `what` is "parse" or a part name; the options only matter for the parts
+        """
+        parts = [solver, input_digest, what, json.dumps(options or {}, sort_keys=True)]
+        return digest("\0".join(parts).encode('utf-8'))
+
+    def path(self, key):
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def get(self, key, default=None):
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return default
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        """
+        store a value, unless it can't be pickled (an open mapping, say);
+        returns whether it was stored
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*/*.pickle"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
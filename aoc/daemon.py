@@ -0,0 +1,141 @@
+"""
+A long-running solver that answers requests over a local Unix socket
+
+Every solver script is imported once when the daemon starts.  Each connection
+carries one request: a JSON header line naming the day, the part, any options and
+optionally the engine, with the length of the input that follows it as raw bytes.
+The reply is one JSON line holding the answer and how long it took, or the error.
+
+Clients are served on their own threads.  The light days are solved right there;
+the CPU-heavy ones go to a pool of worker processes (which import the solvers
+too), so they don't hold the GIL against everybody else.  Each process solves one
+request at a time, resetting the solvers' memos and counters first.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.days import call_part, find_modules, load_module, parts, reset
+from aoc.engines import REFERENCE, engine_functions, has_engine
+
+DEFAULT_SOCKET = "/tmp/aoc2024.sock"
+
+# days that take long enough to be worth shipping to another process
+HEAVY_DAYS = {"06", "20", "24"}
+
+_solvers = {}
+
+# the solvers' memos and counters are module globals, and reset() clears all of them
+# at once, so a process solves one request at a time
+_solving = threading.Lock()
+
+def load_solvers():
+    """
+    import every solver script, keyed by (day, part name)
+    """
+    _solvers.clear()
+    for module_path in find_modules():
+        module = load_module(module_path)
+        for name in parts(module):
+            _solvers[(module_path.parent.name, name)] = module
+
+def start_worker():
+    # Ctrl-C is for the daemon; it shuts the pool down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    load_solvers()
+
+def solve(day, part_name, data, options, engine=REFERENCE):
+    """
+    parse the input and run one part on it, in whichever process this is, from the
+    same cold start the runner gives every input
+    """
+    try:
+        module = _solvers[(day, part_name)]
+    except KeyError:
+        return {"error": f"no {part_name} for day {day}"}
+    if not has_engine(module, engine):
+        return {"error": f"no engine {engine!r} for day {day}"}
+
+    functions = engine_functions(module, engine)
+    with _solving:
+        reset(module)
+        start = time.perf_counter()
+        try:
+            answer = call_part(functions[part_name], functions["parse"](data), options)
+        except Exception as error: # pylint: disable=broad-exception-caught
+            return {"error": "".join(traceback.format_exception_only(error)).strip()}
+
+    return {"answer": answer, "seconds": time.perf_counter() - start}
+
+def read_request(rfile):
+    header = json.loads(rfile.readline())
+    data = rfile.read(header["length"])
+    return header, data
+
+def write_message(wfile, message):
+    wfile.write(json.dumps(message, default=str).encode('utf-8') + b"\n")
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            header, data = read_request(self.rfile)
+            day = f"{int(header['day']):02}"
+            part_name = header.get("part", "part1")
+            options = header.get("options", {})
+            engine = header.get("engine", REFERENCE)
+        except (ValueError, KeyError, TypeError) as error:
+            write_message(self.wfile, {"error": f"bad request: {error}"})
+            return
+
+        if day in HEAVY_DAYS:
+            reply = self.server.pool.submit(solve, day, part_name, data, options, engine).result()
+        else:
+            reply = solve(day, part_name, data, options, engine)
+        write_message(self.wfile, reply)
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers=None):
+        load_solvers()
+        self.pool = ProcessPoolExecutor(workers, initializer=start_worker)
+        super().__init__(socket_path, SolverHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+
+def serve(socket_path=DEFAULT_SOCKET, workers=None):
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    with SolverServer(socket_path, workers) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+def ask(day, part_name, data, options=None, socket_path=DEFAULT_SOCKET, engine=REFERENCE):
+    """
+    send one request to a running daemon and wait for its reply
+    """
+    header = {
+        "day": day, "part": part_name, "options": options or {}, "engine": engine,
+        "length": len(data),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile('rwb') as stream:
+            write_message(stream, header)
+            stream.write(data)
+            stream.flush()
+            return json.loads(stream.readline())
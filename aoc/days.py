@@ -0,0 +1,85 @@
+"""
+Discovery and loading of the daily solver scripts
+"""
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from aoc.counters import reset_counters
+from aoc.memo import reset_memos
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def day_dirs():
+    return sorted(path for path in ROOT.iterdir() if path.is_dir() and path.name.isdigit())
+
+def find_modules(days=None):
+    """
+    find every solver script, optionally limited to the given day strings ("06", "24", ...)
+    """
+    modules = []
+    for day_dir in day_dirs():
+        if days and day_dir.name not in days:
+            continue
+        modules += sorted(day_dir.glob("*.py"))
+
+    return modules
+
+def find_inputs(module_path, pattern="*.txt"):
+    return sorted(module_path.parent.glob(pattern))
+
+def module_name(module_path):
+    return f"{module_path.parent.name}/{module_path.name}"
+
+def load_module(module_path):
+    """
+    import a solver script as a brand new module object,
+    so that module-level state never leaks from one load to the next
+    """
+    module_path = Path(module_path)
+    spec = importlib.util.spec_from_file_location(
+        f"day{module_path.parent.name}_{module_path.stem}", module_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    # registered so that pickle can find the solver's classes again
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def select_days(specs):
+    """
+    turn day arguments like "6", "06" or "01..25" into day strings; none means every day
+    """
+    days = []
+    for spec in specs:
+        first, _, last = spec.partition("..")
+        for day in range(int(first), int(last or first) + 1):
+            days.append(f"{day:02}")
+    return days or None
+
+def reset(module):
+    """
+    clear the solvers' memos and work counters, and any other state a solver exposes
+    reset() for, so that a module imported once can be run again from a cold start
+    """
+    reset_memos()
+    reset_counters()
+    reset_state = getattr(module, "reset", None)
+    if reset_state:
+        reset_state()
+
+def parts(module):
+    """
+    the part functions a solver script has; a day split over two scripts has one in each
+    """
+    return {name: getattr(module, name) for name in ("part1", "part2") if hasattr(module, name)}
+
+def call_part(part, parsed, options):
+    """
+    call a part with whichever of the options it takes, since e.g. only day 18's part 1
+    cares how many bytes have fallen
+    """
+    accepted = inspect.signature(part).parameters
+    return part(parsed, **{name: value for name, value in options.items() if name in accepted})
@@ -0,0 +1,54 @@
+"""
+Several implementations of one day, chosen by name
+
+A solver script's own parse/part1/part2 are its "reference" engine: the trusted
+version the others are checked against.  A script with faster (or otherwise
+different) ones lists them in a module-level ENGINES dict, from the engine's name
+to the functions it replaces:
+
+    ENGINES = {"fast": {"part2": fast_part2}}
+
+Anything an engine doesn't list is the reference's, so an engine only has to
+supply what it changes, and can bring its own parse() if it needs its input in
+another shape.
+"""
+
+from aoc.days import parts
+
+REFERENCE = "reference"
+
+def engines(module):
+    """
+    the names of every engine a script has, the reference first
+    """
+    return [REFERENCE, *getattr(module, "ENGINES", {})]
+
+def has_engine(module, engine):
+    return engine in engines(module)
+
+def engine_functions(module, engine=REFERENCE):
+    """
+    parse and the part functions of one engine, by name; ValueError for an engine
+    the script doesn't have
+    """
+    functions = {"parse": module.parse} | parts(module)
+    if engine == REFERENCE:
+        return functions
+
+    registry = getattr(module, "ENGINES", {})
+    if engine not in registry:
+        raise ValueError(f"no engine {engine!r}; there is {', '.join(engines(module))}")
+    return functions | {name: func for name, func in registry[engine].items() if name in functions}
+
+def case_name(name, engine):
+    """
+    how results of a non-reference engine are labelled, e.g. "09/defrag2.py[fast]"
+    """
+    return name if engine == REFERENCE else f"{name}[{engine}]"
+
+def add_engine_argument(parser, registry):
+    """
+    --engine for a day script with its own ENGINES
+    """
+    parser.add_argument("--engine", choices=[REFERENCE, *registry], default=REFERENCE,
+                        help="which implementation to run (default: %(default)s)")
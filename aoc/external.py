@@ -0,0 +1,109 @@
+"""
+Sorting more numbers than fit in memory
+
+An ExternalSorter collects ints into an array, and each time that reaches its run
+size, sorts it and writes it to a file in the working directory as raw int64s.
+merged() then streams every run back in order through heapq.merge, reading each
+run a block at a time, so it can be walked as often as needed without any of it
+being held.  Sorting a run is the expensive part for memory: the array, the list
+sorted() builds of it and an int object per number, about BYTES_PER_SORTED each.
+
+A small budget on a big input makes thousands of runs, and merging them all at
+once would open a file for each and leave each only a sliver of the memory to
+read with.  So no more than `fan_in` runs are ever merged together: while there
+are more than that, they are merged in groups of `fan_in` into longer runs on
+disk, and only the last pass is streamed.
+"""
+
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+
+ITEM_SIZE = array('q').itemsize
+BYTES_PER_SORTED = 56
+MIN_RUN = 1024
+MIN_BLOCK = 256
+FAN_IN = 64
+
+def read_run(path, block_size):
+    with open(path, 'rb') as file:
+        while True:
+            block = array('q')
+            try:
+                block.fromfile(file, block_size)
+            except EOFError:
+                # what was there was still read
+                yield from block
+                return
+            yield from block
+
+class ExternalSorter:
+    """
+    sorts up to `memory` bytes' worth of numbers at a time, spilling sorted runs
+    into `directory`; use it as a context manager to clean them up
+    """
+
+    def __init__(self, memory, directory=None, fan_in=FAN_IN):
+        self.memory = memory
+        self.run_size = max(MIN_RUN, memory // BYTES_PER_SORTED)
+        self.directory = directory
+        self.fan_in = max(2, fan_in)
+        self.pending = array('q')
+        self.runs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def extend(self, values):
+        self.pending.extend(values)
+        while len(self.pending) >= self.run_size:
+            self.spill(self.pending[:self.run_size])
+            del self.pending[:self.run_size]
+
+    def spill(self, values):
+        run = array('q', sorted(values))
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".run", delete=False) as file:
+            run.tofile(file)
+        self.runs.append(file.name)
+
+    def merge_runs(self, paths):
+        """
+        merge some runs into one new run, a block at a time, and delete them
+        """
+        # a block for each run read, and one for the run written
+        block_size = max(MIN_BLOCK, self.memory // (ITEM_SIZE * (len(paths) + 1)))
+        values = heapq.merge(*(read_run(path, block_size) for path in paths))
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".run", delete=False) as file:
+            while block := array('q', islice(values, block_size)):
+                block.tofile(file)
+        for path in paths:
+            os.unlink(path)
+        return file.name
+
+    def merged(self):
+        """
+        every number so far, in order; the last partial run is written out first, so
+        that the block reads are the only memory used
+        """
+        if self.pending:
+            self.spill(self.pending)
+            self.pending = array('q')
+        while len(self.runs) > self.fan_in:
+            groups = [self.runs[start:start + self.fan_in]
+                      for start in range(0, len(self.runs), self.fan_in)]
+            self.runs = []
+            for group in groups:
+                self.runs.append(self.merge_runs(group) if len(group) > 1 else group[0])
+
+        block_size = max(MIN_BLOCK, self.memory // (ITEM_SIZE * max(1, len(self.runs))))
+        return heapq.merge(*(read_run(path, block_size) for path in self.runs))
+
+    def close(self):
+        for path in self.runs:
+            os.unlink(path)
+        self.runs = []
@@ -0,0 +1,114 @@
+"""
+A compact grid of single-byte cells
+
+The cells live in one flat bytearray, one row after another, surrounded by a border
+of OUTSIDE sentinel cells.  Every cell is addressed by its flat index, so a step in
+any direction is just adding one of the `offsets`, and since the border catches
+anything that walks off the edge, there are no bounds checks.
+
+Solvers index `cells` directly, binding it to a local once before a hot loop,
+rather than going through a method call for every cell.
+"""
+
+OUTSIDE = 0
+
+class Grid:
+    """
+    `pad` is how thick the border is; it only needs to be more than 1 when something
+    jumps further than one cell at a time
+    """
+
+    def __init__(self, width, height, pad=1, fill=ord(".")):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+        self.cells = bytearray([OUTSIDE]) * (self.stride * (height + 2 * pad))
+        for r in range(height):
+            start = self.index(r, 0)
+            self.cells[start:start + width] = bytes([fill]) * width
+
+        # N, E, S, W
+        self.offsets = (-self.stride, 1, self.stride, -1)
+
+    @classmethod
+    def from_lines(cls, lines, pad=1):
+        """
+        a grid of the non-blank lines, which must all be as wide as the first; a
+        ragged one is a ValueError, since it would shift every cell after it
+        """
+        rows = [line.strip().encode('utf-8') for line in lines]
+        rows = [row for row in rows if row]
+        grid = cls(len(rows[0]) if rows else 0, len(rows), pad)
+        for r, row in enumerate(rows):
+            if len(row) != grid.width:
+                raise ValueError(f"row {r + 1} is {len(row)} cells wide, not {grid.width}")
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.width] = row
+        return grid
+
+    @classmethod
+    def parse(cls, text, pad=1):
+        return cls.from_lines(text.splitlines(), pad)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def copy(self):
+        other = Grid.__new__(Grid)
+        other.__dict__.update(self.__dict__)
+        other.cells = bytearray(self.cells)
+        return other
+
+    def index(self, r, c):
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def position(self, index):
+        r, c = divmod(index, self.stride)
+        return r - self.pad, c - self.pad
+
+    def contains(self, r, c):
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def indexes(self):
+        """
+        every index inside the border, in reading order
+        """
+        for r in range(self.height):
+            start = self.index(r, 0)
+            yield from range(start, start + self.width)
+
+    def neighbors(self, index):
+        """
+        the up-to-four neighbors of a cell that aren't off the edge
+        """
+        cells = self.cells
+        for offset in self.offsets:
+            neighbor = index + offset
+            if cells[neighbor] != OUTSIDE:
+                yield neighbor
+
+    def find(self, value):
+        """
+        the index of the first cell holding `value` (a character or a byte value)
+        """
+        index = self.cells.find(self.as_byte(value))
+        if index < 0:
+            raise ValueError(f"{value!r} not found in grid")
+        return index
+
+    def find_all(self, value):
+        needle = self.as_byte(value)
+        index = self.cells.find(needle)
+        while index >= 0:
+            yield index
+            index = self.cells.find(needle, index + 1)
+
+    def lines(self):
+        for r in range(self.height):
+            start = self.index(r, 0)
+            yield self.cells[start:start + self.width].decode('utf-8')
+
+    @staticmethod
+    def as_byte(value):
+        return ord(value) if isinstance(value, str) else value
@@ -0,0 +1,164 @@
+"""
+Reading puzzle input
+"""
+
+import mmap
+import os
+import sys
+
+# the input name that means standard input
+STDIN = "-"
+
+def is_path(source):
+    """
+    whether `source` names a file, as opposed to being the puzzle text itself
+
+    Any str without a line break is a path, whether or not the file is there, so
+    that a missing one is a FileNotFoundError rather than being solved as the
+    puzzle; text (or bytes) given inline has to hold at least one newline
+    """
+    if isinstance(source, os.PathLike):
+        return True
+    return isinstance(source, str) and "\n" not in source
+
+def read_text(source):
+    """
+    accept either the puzzle text itself or the path of a file holding it
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return source.decode('utf-8')
+    if source == STDIN:
+        return sys.stdin.read()
+    if is_path(source):
+        with open(source, 'r', encoding='utf-8') as file:
+            return file.read()
+    return source
+
+def read_lines(source):
+    """
+    the input's lines one at a time, without their newlines, so that the whole input
+    never has to be held at once; takes what read_text does, plus STDIN
+    """
+    if source == STDIN:
+        for line in sys.stdin:
+            yield line.rstrip("\n")
+    elif is_path(source):
+        with open(source, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield line.rstrip("\n")
+    else:
+        yield from read_text(source).splitlines()
+
+def read_pieces(source, size=1 << 16):
+    """
+    the input's bytes in pieces of `size`, wherever they happen to fall (even in the
+    middle of a line); takes what read_lines does
+    """
+    if source == STDIN:
+        file = sys.stdin.buffer
+        while piece := file.read(size):
+            yield piece
+    elif is_path(source):
+        with open(source, 'rb') as file:
+            while piece := file.read(size):
+                yield piece
+    else:
+        data = source.encode('utf-8') if isinstance(source, str) else source
+        for start in range(0, len(data), size):
+            yield data[start:start + size]
+
+def read_blocks(source):
+    """
+    the input's blank-line separated blocks one at a time, each a list of its lines
+    """
+    block = []
+    for line in read_lines(source):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+class MappedInput:
+    """
+    puzzle input mapped straight from its file, so it is never read into memory as a whole
+
+    Everything handed out is a memoryview slice of the mapping, so nothing gets copied
+    until a caller decodes it.  Text and bytes are accepted too (they just aren't
+    mapped), so solvers can keep taking either a path or the puzzle itself.
+    """
+
+    def __init__(self, source):
+        self._mapping = None
+        if is_path(source):
+            with open(source, 'rb') as file:
+                # an empty file can't be mapped
+                if os.fstat(file.fileno()).st_size:
+                    self._mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data = self._mapping if self._mapping is not None else b""
+        elif isinstance(source, str):
+            self.data = source.encode('utf-8')
+        else:
+            self.data = source
+        self.view = memoryview(self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    def close(self):
+        self.view.release()
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                # somebody still holds a slice; the mapping goes away along with it
+                pass
+
+    def lines(self):
+        data = self.data
+        start = 0
+        while start < len(data):
+            end = data.find(b"\n", start)
+            if end < 0:
+                end = len(data)
+            yield self.view[start:end]
+            start = end + 1
+
+    def stripped(self):
+        """
+        the whole input without leading or trailing whitespace
+        """
+        data = self.data
+        start, end = 0, len(data)
+        while start < end and data[start:start + 1].isspace():
+            start += 1
+        while end > start and data[end - 1:end].isspace():
+            end -= 1
+        return self.view[start:end]
+
+    def blocks(self, separator=b"\n\n"):
+        """
+        the pieces of the input between blank lines (or any other separator)
+        """
+        data = self.data
+        start = 0
+        while start < len(data):
+            end = data.find(separator, start)
+            if end < 0:
+                end = len(data)
+            if end > start:
+                yield self.view[start:end]
+            start = end + len(separator)
+
+    def text_blocks(self, separator=b"\n\n"):
+        for block in self.blocks(separator):
+            with block:
+                yield str(block, 'utf-8')
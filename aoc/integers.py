@@ -0,0 +1,146 @@
+"""
+Pulling every integer out of the input in bulk
+
+Rather than splitting each line into fields and slicing labels off them in Python,
+every byte that isn't a digit, a '-' or a newline is translated to a space in one
+pass (bytes.translate runs in C), which leaves the numbers separated by whitespace
+and ready for int().  A '-' counts as a minus sign exactly when a digit follows it,
+so any other is spaced out too, and one right after a digit gets a space before it;
+those are rare, and when a chunk has no '-' at all that step is skipped.
+
+The input is read in chunks of whole lines, so besides the numbers themselves only
+one chunk is ever held.  integers() gives an array('q'), or a NumPy int64 array
+with as_numpy=True; NumPy is optional and only needed for that.
+"""
+
+import io
+import re
+import sys
+from array import array
+
+from aoc.inputs import STDIN, is_path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CHUNK_SIZE = 1 << 20
+
+_SPACES = bytes(byte if chr(byte) in "0123456789-\n" else ord(" ") for byte in range(256))
+_STRAY_MINUS = re.compile(rb"-(?!\d)")
+_JOINED_MINUS = re.compile(rb"-(?<=\d-)")
+
+def _read_chunks(file, size):
+    rest = b""
+    while piece := file.read(size):
+        piece = rest + piece
+        cut = piece.rfind(b"\n") + 1
+        rest = piece[cut:]
+        if cut:
+            yield piece[:cut]
+    if rest:
+        yield rest
+
+def read_chunks(source, size=CHUNK_SIZE):
+    """
+    the input as bytes, in pieces of about `size` that each end at a line break;
+    takes what read_lines does
+    """
+    if source == STDIN:
+        yield from _read_chunks(sys.stdin.buffer, size)
+    elif is_path(source):
+        with open(source, 'rb') as file:
+            yield from _read_chunks(file, size)
+    else:
+        data = source.encode('utf-8') if isinstance(source, str) else bytes(source)
+        yield from _read_chunks(io.BytesIO(data), size)
+
+def spaced(data):
+    """
+    the integers in some bytes with only whitespace between them; newlines are kept
+    """
+    spaced_data = data.translate(_SPACES)
+    if b"-" in spaced_data:
+        spaced_data = _STRAY_MINUS.sub(b" ", spaced_data)
+        spaced_data = _JOINED_MINUS.sub(b" -", spaced_data)
+    return spaced_data
+
+def iter_integers(source):
+    """
+    every integer in the input, one at a time
+    """
+    for chunk in read_chunks(source):
+        yield from map(int, spaced(chunk).split())
+
+def integer_chunks(source):
+    """
+    the integers of each chunk of whole lines as an array, one chunk at a time
+    """
+    for chunk in read_chunks(source):
+        yield array('q', map(int, spaced(chunk).split()))
+
+def integer_rows(source):
+    """
+    a list of the integers on each line, one line at a time; a line without any
+    (a blank one, say) gives an empty list
+    """
+    for chunk in read_chunks(source):
+        if chunk.endswith(b"\n"):
+            chunk = chunk[:-1]
+        for line in spaced(chunk).split(b"\n"):
+            yield list(map(int, line.split()))
+
+def rows_by_length(source):
+    """
+    the input's lines grouped by how many integers they hold, each group a 2D NumPy
+    int64 array with one line per row (in input order); needs NumPy
+
+    Nothing is done line by line in Python: which line each number is on comes from
+    a running count of the newlines before it, and each chunk's numbers are then
+    sorted into groups with one mask per distinct length
+    """
+    if numpy is None:
+        raise ImportError("rows_by_length() needs NumPy installed")
+
+    groups = {}
+    for chunk in read_chunks(source):
+        text = spaced(chunk)
+        if not text.endswith(b"\n"):
+            text += b"\n"
+        buffer = numpy.frombuffer(text, dtype=numpy.uint8)
+        newline = buffer == ord("\n")
+        blank = newline | (buffer == ord(" "))
+        starts = ~blank
+        starts[1:] &= blank[:-1]
+        line_of = numpy.cumsum(newline) - newline
+        lengths = numpy.bincount(line_of[starts], minlength=int(newline.sum()))
+
+        values = numpy.fromstring(text, dtype=numpy.int64, sep=" ")
+        value_lengths = numpy.repeat(lengths, lengths)
+        for length in numpy.unique(lengths).tolist():
+            if length:
+                rows = values[value_lengths == length].reshape(-1, length)
+            else:
+                rows = numpy.zeros((int((lengths == 0).sum()), 0), dtype=numpy.int64)
+            groups.setdefault(length, []).append(rows)
+
+    return {length: numpy.concatenate(rows) for length, rows in sorted(groups.items())}
+
+def integers(source, as_numpy=False):
+    """
+    every integer in the input, as one array
+    """
+    if as_numpy:
+        if numpy is None:
+            raise ImportError("integers(as_numpy=True) needs NumPy installed")
+        parts = [
+            numpy.fromstring(spaced(chunk), dtype=numpy.int64, sep=" ")
+            for chunk in read_chunks(source)
+        ]
+        return numpy.concatenate(parts) if parts else numpy.zeros(0, dtype=numpy.int64)
+
+    values = array('q')
+    for chunk in integer_chunks(source):
+        values.extend(chunk)
+    return values
@@ -0,0 +1,127 @@
+"""
+Memo caches for the solvers, with size bounds and counters
+
+A Memo is a small dict-like cache that counts its hits, misses and evictions.
+Given a `maxsize` it keeps only that many entries, dropping the least recently
+used; given a `spill` path as well, what it drops goes to a shelve file on disk
+instead, and is looked up there before counting as a miss.
+
+Every Memo is registered when it is made.  A RUN-scoped memo (the default) is
+cleared by reset_memos(), which the runner calls before every input, so timings
+don't depend on what ran earlier; a PERSISTENT one keeps its entries for the
+life of the process.
+"""
+
+import shelve
+import weakref
+from collections import OrderedDict
+from functools import wraps
+
+RUN = "run"
+PERSISTENT = "persistent"
+
+# the bound for memos that don't give their own; None is unbounded
+default_maxsize = None # pylint: disable=invalid-name
+
+_memos = weakref.WeakSet()
+_MISSING = object()
+
+class Memo:
+    def __init__(self, name, maxsize=_MISSING, scope=RUN, spill=None):
+        self.name = name
+        self.maxsize = default_maxsize if maxsize is _MISSING else maxsize
+        self.scope = scope
+        self.spill = spill
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._shelf = None
+        _memos.add(self)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        entries = self.entries
+        value = entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            if self.maxsize is not None:
+                entries.move_to_end(key)
+            return value
+
+        if self._shelf is not None:
+            value = self._shelf.get(repr(key), _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                self[key] = value
+                return value
+
+        self.misses += 1
+        return default
+
+    def __setitem__(self, key, value):
+        entries = self.entries
+        entries[key] = value
+        if self.maxsize is not None and len(entries) > self.maxsize:
+            old_key, old_value = entries.popitem(last=False)
+            self.evictions += 1
+            if self.spill:
+                if self._shelf is None:
+                    self._shelf = shelve.open(self.spill, 'n')
+                self._shelf[repr(old_key)] = old_value
+
+    def clear(self):
+        self.entries.clear()
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+def memoize(name, maxsize=_MISSING, scope=RUN, spill=None):
+    """
+    memoize a function on its (hashable) arguments; the Memo is its `memo` attribute
+    """
+    def decorate(func):
+        memo = Memo(name, maxsize, scope, spill)
+
+        @wraps(func)
+        def wrapper(*args):
+            value = memo.get(args, _MISSING)
+            if value is _MISSING:
+                value = func(*args)
+                memo[args] = value
+            return value
+
+        wrapper.memo = memo
+        return wrapper
+
+    return decorate
+
+def reset_memos():
+    """
+    clear every RUN-scoped memo, and start the counters over on all of them
+    """
+    for memo in list(_memos):
+        if memo.scope == RUN:
+            memo.clear()
+        memo.hits = memo.misses = memo.evictions = 0
+
+def memo_stats():
+    """
+    the counters of every memo, added up by name (a solver loaded twice has two of each)
+    """
+    stats = {}
+    for memo in sorted(_memos, key=lambda memo: memo.name):
+        totals = stats.setdefault(memo.name, dict.fromkeys(memo.stats(), 0))
+        for counter, value in memo.stats().items():
+            totals[counter] += value
+    return stats
@@ -0,0 +1,14 @@
+"""
+Extra options that some days' parts need on top of the parsed input
+
+The parts' defaults are right for the real puzzle inputs, but the examples are smaller.
+"""
+
+FIXTURE_OPTIONS = {
+    "14/test.txt": {"width": 11, "height": 7},
+    "18/test.txt": {"width": 7, "height": 7, "fallen": 12},
+    "20/test.txt": {"min_savings": 50},
+}
+
+def options_for(day, input_name):
+    return FIXTURE_OPTIONS.get(f"{day}/{input_name}", {})
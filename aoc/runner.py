@@ -0,0 +1,109 @@
+"""
+Run any selection of days and inputs in one process
+
+Each solver script is imported once and reused for every input it runs on; its
+caches are reset before each run so the timings don't depend on what ran before.
+
+Given a ResultCache, answers (and parsed inputs) seen before are loaded rather
+than worked out again, and the input isn't even parsed when every answer is there.
+
+Any engine can be asked for (see aoc.engines); scripts that don't have it run
+their reference engine, and each result says which one ran.
+"""
+
+import time
+import traceback
+from pathlib import Path
+
+from aoc import counters
+from aoc.cache import digest, solver_digest
+from aoc.days import call_part, find_inputs, find_modules, load_module, module_name, reset
+from aoc.engines import REFERENCE, engine_functions, has_engine
+from aoc.memo import memo_stats
+from aoc.options import options_for
+
+_MISSING = object()
+
+def cache_keys(cache, module, input_path, options, functions, engine=REFERENCE):
+    solver = solver_digest(module)
+    input_digest = digest(Path(input_path).read_bytes())
+    prefix = "" if engine == REFERENCE else f"{engine}:"
+    keys = {"parse": cache.key(solver, input_digest, prefix + "parse")}
+    for name in functions:
+        if name != "parse":
+            keys[name] = cache.key(solver, input_digest, prefix + name, options)
+    return keys
+
+def lookup(cache, keys, what, result):
+    if not keys:
+        return _MISSING
+
+    start = time.perf_counter()
+    value = cache.get(keys[what], _MISSING)
+    if value is not _MISSING:
+        result["timings"][what] = time.perf_counter() - start
+        result["cached"].append(what)
+    return value
+
+def parse_input(parse, input_path, cache, keys, result):
+    parsed = lookup(cache, keys, "parse", result)
+    if parsed is _MISSING:
+        start = time.perf_counter()
+        parsed = parse(Path(input_path))
+        result["timings"]["parse"] = time.perf_counter() - start
+        if keys:
+            cache.put(keys["parse"], parsed)
+    return parsed
+
+def run_input(module, input_path, options, cache=None, engine=REFERENCE):
+    """
+    parse one input and run every part on it, timing each step; failures are
+    recorded rather than raised, so one bad input doesn't stop the rest
+    """
+    reset(module)
+    if not has_engine(module, engine):
+        engine = REFERENCE
+    result = {"engine": engine, "answers": {}, "timings": {}, "cached": []}
+    try:
+        functions = engine_functions(module, engine)
+        keys = cache_keys(cache, module, input_path, options, functions, engine) if cache else None
+        parsed = _MISSING
+        for name, part in functions.items():
+            if name == "parse":
+                continue
+            answer = lookup(cache, keys, name, result)
+            if answer is _MISSING:
+                if parsed is _MISSING:
+                    parsed = parse_input(functions["parse"], input_path, cache, keys, result)
+                start = time.perf_counter()
+                answer = call_part(part, parsed, options)
+                result["timings"][name] = time.perf_counter() - start
+                if keys:
+                    cache.put(keys[name], answer)
+            result["answers"][name] = answer
+    except Exception as error: # pylint: disable=broad-exception-caught
+        result["error"] = "".join(traceback.format_exception_only(error)).strip()
+
+    if counters.enabled():
+        result["counters"] = counters.counter_values()
+    result["memos"] = {
+        name: stats for name, stats in memo_stats().items() if stats["hits"] or stats["misses"]
+    }
+    return result
+
+def run_days(days=None, pattern="*.txt", progress=None, cache=None, engine=REFERENCE):
+    """
+    run every solver for the given days over its inputs, calling
+    progress(module_name, input_name, result) as each one finishes
+    """
+    results = {}
+    for module_path in find_modules(days):
+        module = load_module(module_path)
+        day = module_path.parent.name
+        for input_path in find_inputs(module_path, pattern):
+            result = run_input(module, input_path, options_for(day, input_path.name), cache, engine)
+            results[(module_name(module_path), input_path.name)] = result
+            if progress:
+                progress(module_name(module_path), input_path.name, result)
+
+    return results
@@ -0,0 +1,102 @@
+"""
+Shortest-path searches over states numbered 0 to size - 1
+
+A state is whatever the day packs into an int (a grid index, or index * 4 plus a
+direction).  Distances live in an array('q') with UNREACHED for states never
+reached, and the heap holds single ints with the cost packed above the state,
+so nothing is allocated per step beyond the ints themselves.
+
+The searches take their graph as a function: `neighbors(state)` yields states one
+step away for bfs, and `edges(state)` yields (state, cost) pairs for dijkstra.
+Every search takes several sources, so a reverse search is just the same search
+from the targets over a function yielding predecessors instead.  `limit`
+bounds how far a search goes; anything further stays UNREACHED.
+"""
+
+import heapq
+from array import array
+
+from aoc import counters
+
+UNREACHED = -1
+
+def unreached(size):
+    return array('q', [UNREACHED]) * size
+
+def bfs(size, sources, neighbors, limit=None, target=None):
+    """
+    distances when every step costs 1, one frontier at a time;
+    stops early once `target` is reached
+    """
+    dist = unreached(size)
+    frontier = []
+    for source in sources:
+        if dist[source] == UNREACHED:
+            dist[source] = 0
+            frontier.append(source)
+
+    steps = 0
+    expanded = 0
+    while frontier and (target is None or dist[target] == UNREACHED):
+        if limit is not None and steps >= limit:
+            break
+        steps += 1
+        expanded += len(frontier)
+        next_frontier = []
+        for state in frontier:
+            for neighbor in neighbors(state):
+                if dist[neighbor] == UNREACHED:
+                    dist[neighbor] = steps
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    counters.count("search/bfs expansions", expanded)
+    return dist
+
+def dijkstra(size, sources, edges, limit=None, target=None):
+    """
+    distances when steps cost different amounts; stops early once `target` is settled
+    """
+    dist = unreached(size)
+    shift = size.bit_length()
+    mask = (1 << shift) - 1
+
+    heap = []
+    for source in sources:
+        dist[source] = 0
+        heap.append(source)
+    heapq.heapify(heap)
+
+    settled = bytearray(size)
+    pushes = 0
+    while heap:
+        packed = heapq.heappop(heap)
+        state = packed & mask
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if state == target:
+            break
+
+        cost = packed >> shift
+        for neighbor, step in edges(state):
+            new_cost = cost + step
+            if limit is not None and new_cost > limit:
+                continue
+            if dist[neighbor] == UNREACHED or new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost << shift) | neighbor)
+                pushes += 1
+
+    counters.count("search/dijkstra heap pushes", pushes)
+    return dist
+
+def on_cheapest_paths(forward, backward, best):
+    """
+    the states on some cheapest path, given distances from the sources, distances
+    back from the targets (a reverse search) and the cheapest total
+    """
+    return [
+        state for state, (there, back) in enumerate(zip(forward, backward))
+        if there != UNREACHED and back != UNREACHED and there + back == best
+    ]
@@ -0,0 +1,5 @@
+"""
+Benchmark suite for the daily solvers
+
+Run with `python -m bench --help` from the top of the repo.
+"""
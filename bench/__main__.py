@@ -0,0 +1,97 @@
+"""
+Benchmark the daily solvers
+
+    python -m bench                          # every day, over the checked-in fixtures
+    python -m bench 06 24 --sizes 1000 10000 # also over synthetic inputs of those sizes
+    python -m bench --baseline old.json      # fail if anything regressed against old.json
+    python -m bench 01 09 --scaling          # fit time and memory against input size
+"""
+
+import argparse
+import json
+import sys
+
+from bench.compare import find_regressions, format_regression
+from bench.scaling import format_scaling, geometric_sizes, run_scaling
+from bench.suite import PHASES, run_suite
+
+def print_case(case, result):
+    for phase in PHASES:
+        if phase in result:
+            measured = result[phase]
+            print(
+                f"{case:<40} {phase:<6} wall {measured['wall']:9.4f}s  cpu {measured['cpu']:9.4f}s"
+                f"  peak {measured['peak_memory'] / 1024:10.1f} KiB"
+            )
+    if result["status"] != "ok":
+        print(f"{case:<40} {result['error']}")
+
+def print_sample(name, sample):
+    took = sum(sample[phase]["wall"] for phase in PHASES if phase in sample)
+    print(f"{name:<24} size {sample['size']:>7}  {sample['bytes']:>11} bytes  {took:9.4f}s")
+
+def scaling(args):
+    sizes = args.sizes or geometric_sizes(args.scale_start, args.scale_factor, args.scale_steps)
+    results = run_scaling(
+        args.days, sizes, args.seed, args.repeat, args.scale_budget, args.superlinear, print_sample
+    )
+    with open(args.output or "scaling_results.json", 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    print()
+    print(format_scaling(results))
+
+def main():
+    parser = argparse.ArgumentParser(description="Advent of Code 2024 benchmarks")
+    parser.add_argument("days", nargs="*", help="days to run, e.g. 06 24 (default: all)")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="fixture file glob (default: %(default)s)")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[], help="synthetic input sizes")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic input seed")
+    parser.add_argument("--repeat", type=int, default=1, help="timing runs per case (best is kept)")
+    parser.add_argument("--output",
+                        help="where to write the JSON results (default: bench_results.json,"
+                        " or scaling_results.json with --scaling)")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown/growth over the baseline, as a fraction")
+    parser.add_argument("--scaling", action="store_true",
+                        help="run synthetic inputs of growing sizes and fit how each phase scales")
+    parser.add_argument("--scale-start", type=int, default=250, help="smallest scaling size")
+    parser.add_argument("--scale-factor", type=float, default=2,
+                        help="growth between scaling sizes")
+    parser.add_argument("--scale-steps", type=int, default=5, help="number of scaling sizes")
+    parser.add_argument("--scale-budget", type=float, default=10,
+                        help="seconds one size may take before a module stops growing")
+    parser.add_argument("--superlinear", type=float, default=1.3,
+                        help="exponent above which growth is flagged (default: %(default)s)")
+
+    args = parser.parse_args()
+
+    if args.scaling:
+        scaling(args)
+        return
+
+    results = run_suite(args.days, args.pattern, args.sizes, args.seed, args.repeat, print_case)
+    with open(args.output or "bench_results.json", 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    mismatches = [
+        case for case, result in results["cases"].items() if result["status"] == "mismatch"
+    ]
+    for case in mismatches:
+        print(f"MISMATCH {case}: {results['cases'][case]['error']}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {format_regression(regression)}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Comparison of a benchmark run against a stored baseline
+"""
+
+from bench.suite import PHASES
+
+METRICS = ("wall", "cpu", "peak_memory")
+
+# differences below these are noise, no matter what the ratio says
+NOISE_FLOORS = {
+    "wall": 0.005,
+    "cpu": 0.005,
+    "peak_memory": 64 * 1024,
+}
+
+def find_regressions(results, baseline, threshold, metrics=METRICS):
+    """
+    list every (case, phase, metric) that got worse than the baseline by more than
+    `threshold` (a fraction, so 0.25 means 25% slower or bigger); work counters are
+    compared too, as "counter:<name>", and since they don't jitter they have no floor;
+    a case that was ok in the baseline and now fails is the worst regression of all,
+    and shows up as its "status"
+    """
+    regressions = []
+    for name, result in results["cases"].items():
+        old = baseline["cases"].get(name)
+        if not old:
+            continue
+
+        if old.get("status", "ok") == "ok" and result["status"] != "ok":
+            regressions.append({
+                "case": name,
+                "phase": "-",
+                "metric": "status",
+                "baseline": old.get("status", "ok"),
+                "current": result["status"],
+                "error": result.get("error", ""),
+            })
+            continue
+
+        for phase in PHASES:
+            if phase not in result or phase not in old:
+                continue
+            pairs = [(metric, old[phase][metric], result[phase][metric]) for metric in metrics]
+            old_counters = old[phase].get("counters", {})
+            for counter, after in result[phase].get("counters", {}).items():
+                if counter in old_counters:
+                    pairs.append((f"counter:{counter}", old_counters[counter], after))
+
+            for metric, before, after in pairs:
+                if after - before <= NOISE_FLOORS.get(metric, 0):
+                    continue
+                if after > before * (1 + threshold):
+                    regressions.append({
+                        "case": name,
+                        "phase": phase,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "ratio": after / before if before else float("inf"),
+                    })
+
+    return regressions
+
+def format_regression(regression):
+    if regression["metric"] == "status":
+        return (
+            f"{regression['case']}: {regression['baseline']} -> {regression['current']}"
+            f" ({regression['error']})"
+        )
+    return (
+        f"{regression['case']} {regression['phase']}: {regression['metric']} "
+        f"{regression['baseline']:.4g} -> {regression['current']:.4g} "
+        f"({regression['ratio']:.2f}x)"
+    )
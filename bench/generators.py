@@ -0,0 +1,513 @@
+"""
+Synthetic puzzle input generators
+
+Each generator takes the file to write, a size and a seed, and returns the extra
+options (if any) that the day's parts need to solve that input.  For grid days the size
+is the side of an N x N grid; for everything else it is the number of records.
+"""
+
+import random
+import string
+from collections import deque
+from math import isqrt
+
+def write_lines(path, lines):
+    with open(path, 'w', encoding='utf-8') as file:
+        for line in lines:
+            file.write(line)
+            file.write("\n")
+
+def odd(size, minimum=5):
+    size = max(size, minimum)
+    return size if size % 2 else size + 1
+
+def carve_maze(size, rng, extra_openings=0.0):
+    """
+    a perfect maze (one route between any two cells) on an odd-sized grid,
+    carved with an iterative depth-first search; `extra_openings` knocks out
+    that fraction of the remaining inner walls to add loops
+    """
+    grid = [["#"] * size for _ in range(size)]
+    start = (size - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and grid[r + dr][c + dc] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        grid[(r + nr) // 2][(c + nc) // 2] = "."
+        grid[nr][nc] = "."
+        stack.append((nr, nc))
+
+    for r in range(1, size - 1):
+        for c in range(1, size - 1):
+            if grid[r][c] == "#" and (r % 2 == 1 or c % 2 == 1) and rng.random() < extra_openings:
+                grid[r][c] = "."
+
+    return grid
+
+def maze_path(grid, start, end):
+    """
+    the route between two cells of a perfect maze, found by a breadth-first search
+    """
+    previous = {start: None}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        if (r, c) == end:
+            break
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if grid[nr][nc] != "#" and (nr, nc) not in previous:
+                previous[(nr, nc)] = (r, c)
+                queue.append((nr, nc))
+
+    path = []
+    cell = end
+    while cell:
+        path.append(cell)
+        cell = previous[cell]
+    return path
+
+def day01(path, size, seed):
+    """
+    `size` lines of location ID pairs, both columns drawn from the same pool of IDs so
+    that plenty of them turn up on both sides
+    """
+    rng = random.Random(seed)
+    pool = [rng.randint(10000, 99999) for _ in range(size // 2 + 1)]
+    write_lines(path, (f"{rng.choice(pool)}   {rng.choice(pool)}" for _ in range(size)))
+    return {}
+
+def day02(path, size, seed):
+    """
+    `size` reports, mostly drifting gently so that a good share of them are safe
+    """
+    rng = random.Random(seed)
+    def report():
+        direction = rng.choice((-1, 1))
+        level = rng.randint(20, 80)
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += direction * rng.choice((1, 1, 2, 3, 3, 4, 0, -1))
+            levels.append(level)
+        return " ".join(str(level) for level in levels)
+
+    write_lines(path, (report() for _ in range(size)))
+    return {}
+
+def day03(path, size, seed):
+    """
+    `size` instructions of corrupted memory: real and broken muls, do()s, don't()s and noise
+    """
+    rng = random.Random(seed)
+    noise = "!@#$%^&*()[]{}<>+-_?/,' whymulfromselectdon"
+    def token():
+        roll = rng.random()
+        if roll < 0.6:
+            return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        if roll < 0.7:
+            return f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)}]"
+        if roll < 0.8:
+            return rng.choice(("do()", "don't()"))
+        return "".join(rng.choice(noise) for _ in range(rng.randint(1, 8)))
+
+    tokens = [token() for _ in range(size)]
+    write_lines(path, ("".join(tokens[i:i + 50]) for i in range(0, len(tokens), 50)))
+    return {}
+
+def day04(path, size, seed):
+    """
+    an N x N word search made of X, M, A and S
+    """
+    rng = random.Random(seed)
+    write_lines(path, ("".join(rng.choice("XMAS") for _ in range(size)) for _ in range(size)))
+    return {}
+
+def day05(path, size, seed):
+    """
+    ordering rules for every pair of 49 pages, then `size` updates
+    """
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), 49)
+    lines = [f"{pages[i]}|{pages[j]}" for i in range(len(pages)) for j in range(i + 1, len(pages))]
+    rng.shuffle(lines)
+    lines.append("")
+    for _ in range(size):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        lines.append(",".join(str(page) for page in update))
+
+    write_lines(path, lines)
+    return {}
+
+def day06(path, size, seed):
+    """
+    an N x N lab with scattered obstructions and the guard facing north
+    """
+    rng = random.Random(seed)
+    grid = [["#" if rng.random() < 0.03 else "." for _ in range(size)] for _ in range(size)]
+    grid[size * 3 // 4][size // 2] = "^"
+    write_lines(path, ("".join(row) for row in grid))
+    return {}
+
+def day07(path, size, seed):
+    """
+    `size` equations, about half of them solvable with +, * and ||
+    """
+    rng = random.Random(seed)
+    def equation():
+        values = [rng.randint(1, 99) for _ in range(rng.randint(3, 10))]
+        total = values[0]
+        for value in values[1:]:
+            operator = rng.choice("+*|")
+            if operator == "+":
+                total += value
+            elif operator == "*":
+                total *= value
+            else:
+                total = int(f"{total}{value}")
+        if rng.random() < 0.5:
+            total += 1
+        return f"{total}: {' '.join(str(value) for value in values)}"
+
+    write_lines(path, (equation() for _ in range(size)))
+    return {}
+
+def day08(path, size, seed):
+    """
+    an N x N roof with a few antennas of each of up to 62 frequencies
+    """
+    rng = random.Random(seed)
+    grid = [["."] * size for _ in range(size)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(max(4, size * size // 50)):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    write_lines(path, ("".join(row) for row in grid))
+    return {}
+
+def day09(path, size, seed):
+    """
+    a disk map `size` digits long
+    """
+    rng = random.Random(seed)
+    digits = [str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(size)]
+    write_lines(path, ["".join(digits)])
+    return {}
+
+def day10(path, size, seed):
+    """
+    an N x N topographic map made mostly of diagonal slopes, so that trails exist
+    """
+    rng = random.Random(seed)
+    def height(r, c):
+        return (r + c) % 10 if rng.random() < 0.9 else rng.randint(0, 9)
+    write_lines(path, ("".join(str(height(r, c)) for c in range(size)) for r in range(size)))
+    return {}
+
+def day11(path, size, seed):
+    """
+    `size` stones
+    """
+    rng = random.Random(seed)
+    write_lines(path, [" ".join(str(rng.randint(0, 999999)) for _ in range(size))])
+    return {}
+
+def day12(path, size, seed):
+    """
+    an N x N garden of blobby regions: a coarse random map, scaled up and roughened
+    """
+    rng = random.Random(seed)
+    scale = 4
+    coarse_size = size // scale + 2
+    coarse = [
+        [rng.choice(string.ascii_uppercase) for _ in range(coarse_size)]
+        for _ in range(coarse_size)
+    ]
+    def plant(r, c):
+        return coarse[(r + rng.randint(0, 1)) // scale][(c + rng.randint(0, 1)) // scale]
+    write_lines(path, ("".join(plant(r, c) for c in range(size)) for r in range(size)))
+    return {}
+
+def day13(path, size, seed):
+    """
+    `size` claw machines
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        a = (rng.randint(10, 99), rng.randint(10, 99))
+        b = (rng.randint(10, 99), rng.randint(10, 99))
+        presses = (rng.randint(1, 100), rng.randint(1, 100))
+        prize = [presses[0] * a[i] + presses[1] * b[i] + rng.choice((0, 0, 1)) for i in range(2)]
+        lines += [
+            f"Button A: X+{a[0]}, Y+{a[1]}",
+            f"Button B: X+{b[0]}, Y+{b[1]}",
+            f"Prize: X={prize[0]}, Y={prize[1]}",
+            "",
+        ]
+
+    write_lines(path, lines[:-1])
+    return {}
+
+def day14(path, size, seed):
+    """
+    `size` robots in the standard 101 x 103 bathroom
+    """
+    rng = random.Random(seed)
+    width, height = 101, 103
+    def robot():
+        return (
+            f"p={rng.randrange(width)},{rng.randrange(height)} "
+            f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        )
+    write_lines(path, (robot() for _ in range(size)))
+    return {"width": width, "height": height}
+
+def day15(path, size, seed):
+    """
+    an N x N warehouse with boxes and a few walls, then 10 moves per cell of the side
+    """
+    rng = random.Random(seed)
+    grid = [["#"] * size] + [
+        ["#"] + [rng.choice("..O.O.#.") for _ in range(size - 2)] + ["#"] for _ in range(size - 2)
+    ] + [["#"] * size]
+    grid[size // 2][size // 2] = "@"
+
+    moves = "".join(rng.choice("^>v<") for _ in range(size * 10))
+    lines = ["".join(row) for row in grid] + [""]
+    lines += [moves[i:i + 70] for i in range(0, len(moves), 70)]
+    write_lines(path, lines)
+    return {}
+
+def day16(path, size, seed):
+    """
+    an N x N maze (N rounded up to odd) with some loops, S bottom left and E top right
+    """
+    rng = random.Random(seed)
+    size = odd(size)
+    grid = carve_maze(size, rng, 0.05)
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    write_lines(path, ("".join(row) for row in grid))
+    return {}
+
+def day17(path, size, seed):
+    """
+    a program from the same family as the real puzzle inputs (so that it has a quine),
+    with register A large enough to print `size` values
+    """
+    rng = random.Random(seed)
+    while True:
+        k1, k2 = rng.randrange(8), rng.randrange(8)
+        tape = [2, 4, 1, k1, 7, 5, 1, k2, 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+        if has_quine(tape, k1, k2):
+            break
+
+    lines = [
+        f"Register A: {rng.randrange(8 ** (size - 1), 8 ** size)}",
+        "Register B: 0",
+        "Register C: 0",
+        "",
+        f"Program: {','.join(str(val) for val in tape)}",
+    ]
+    write_lines(path, lines)
+    return {}
+
+def has_quine(tape, k1, k2):
+    """
+    whether some A makes the day 17 program family print itself
+    """
+    def first_output(a):
+        b = (a % 8) ^ k1
+        c = a >> b
+        return ((b ^ k2) ^ c) % 8
+
+    def search(a, goals):
+        if not goals:
+            return True
+        for offset in range(8):
+            candidate = a * 8 + offset
+            if candidate and first_output(candidate) == goals[0] and search(candidate, goals[1:]):
+                return True
+        return False
+
+    return search(0, list(reversed(tape)))
+
+def day18(path, size, seed):
+    """
+    every cell except the corners of a roughly sqrt(size) square memory space,
+    falling in random order, so the exit always gets cut off eventually
+    """
+    rng = random.Random(seed)
+    width = max(3, isqrt(size + 2))
+    cells = [(x, y) for y in range(width) for x in range(width)]
+    cells = cells[1:-1]
+    rng.shuffle(cells)
+    write_lines(path, (f"{x},{y}" for x, y in cells))
+    return {"width": width, "height": width, "fallen": len(cells) // 2}
+
+def day19(path, size, seed):
+    """
+    a few hundred towels, then `size` designs; most are built from the towels
+    """
+    rng = random.Random(seed)
+    colors = "wubrg"
+    towels = sorted({
+        "".join(rng.choice(colors) for _ in range(rng.randint(1, 8))) for _ in range(400)
+    })
+    towels = [towel for towel in towels if towel != "r"] # keep some designs impossible
+
+    def design():
+        pattern = ""
+        while len(pattern) < rng.randint(20, 60):
+            pattern += rng.choice(towels)
+        if rng.random() < 0.3:
+            index = rng.randrange(len(pattern))
+            pattern = pattern[:index] + "r" + pattern[index + 1:]
+        return pattern
+
+    write_lines(path, [", ".join(towels), ""] + [design() for _ in range(size)])
+    return {}
+
+def day20(path, size, seed):
+    """
+    an N x N racetrack (N rounded up to odd): the single route through a random maze
+    """
+    rng = random.Random(seed)
+    size = odd(size)
+    maze = carve_maze(size, rng)
+    track = maze_path(maze, (size - 2, 1), (1, size - 2))
+
+    grid = [["#"] * size for _ in range(size)]
+    for r, c in track:
+        grid[r][c] = "."
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    write_lines(path, ("".join(row) for row in grid))
+    return {"min_savings": 100}
+
+def day21(path, size, seed):
+    """
+    `size` door codes
+    """
+    rng = random.Random(seed)
+    write_lines(path, (f"{rng.randint(1, 999):03}A" for _ in range(size)))
+    return {}
+
+def day22(path, size, seed):
+    """
+    `size` buyers' initial secrets
+    """
+    rng = random.Random(seed)
+    write_lines(path, (str(rng.randint(1, 16777215)) for _ in range(size)))
+    return {}
+
+def day23(path, size, seed):
+    """
+    `size` computers (at most 676, since names are two letters), each linked to
+    about a dozen others, plus one planted LAN party of 13
+    """
+    rng = random.Random(seed)
+    names = [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase]
+    names = rng.sample(names, min(max(size, 13), len(names)))
+
+    links = set()
+    for name in names:
+        for other in rng.sample(names, min(6, len(names) - 1)):
+            if other != name:
+                links.add(tuple(sorted((name, other))))
+    party = names[:13]
+    for i, left in enumerate(party):
+        for right in party[i + 1:]:
+            links.add(tuple(sorted((left, right))))
+
+    links = sorted(links) # a set's order changes with the hash seed
+    rng.shuffle(links)
+    write_lines(path, (f"{left}-{right}" for left, right in links))
+    return {}
+
+def day24(path, size, seed):
+    """
+    a ripple-carry adder with randomly named wires and four pairs of swapped outputs
+
+    Finding the swaps gets slow fast as the adder widens, so it only gets a bit wider
+    each time `size` doubles, up to the 45 bits of the real inputs (the wires are
+    numbered with two digits, too)
+    """
+    rng = random.Random(seed)
+    bits = min(5 + size.bit_length(), 45)
+    used = set()
+    def wire():
+        while True:
+            name = "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+            if name not in used and name[0] not in "xyz":
+                used.add(name)
+                return name
+
+    def bit(prefix, index):
+        return f"{prefix}{index:02}"
+
+    gates = [[bit("x", 0), "XOR", bit("y", 0), bit("z", 0)]]
+    carry = wire()
+    gates.append([bit("x", 0), "AND", bit("y", 0), carry])
+    blocks = []
+    for i in range(1, bits):
+        half_sum, half_carry, carry_through = wire(), wire(), wire()
+        new_carry = bit("z", bits) if i == bits - 1 else wire()
+        block = [
+            [bit("x", i), "XOR", bit("y", i), half_sum],
+            [bit("x", i), "AND", bit("y", i), half_carry],
+            [half_sum, "XOR", carry, bit("z", i)],
+            [half_sum, "AND", carry, carry_through],
+            [half_carry, "OR", carry_through, new_carry],
+        ]
+        blocks.append(block)
+        gates += block
+        carry = new_carry
+
+    # the kinds of swap the real inputs have: the two half adder outputs, or an output
+    # bit with one of the carry gates; at most one per bit, spread out through the adder
+    spread_out = blocks[:-1:3]
+    for block in rng.sample(spread_out, min(4, len(spread_out))):
+        first, second = rng.choice(((0, 1), (2, 3), (2, 4)))
+        block[first][3], block[second][3] = block[second][3], block[first][3]
+
+    lines = [f"{bit('x', i)}: {rng.randint(0, 1)}" for i in range(bits)]
+    lines += [f"{bit('y', i)}: {rng.randint(0, 1)}" for i in range(bits)]
+    lines.append("")
+    rng.shuffle(gates)
+    lines += [f"{left} {op} {right} -> {out}" for left, op, right, out in gates]
+    write_lines(path, lines)
+    return {}
+
+def day25(path, size, seed):
+    """
+    `size` schematics, roughly half locks and half keys
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [
+            "".join("#" if height >= row else "." for height in heights) for row in range(1, 6)
+        ]
+        if rng.random() < 0.5:
+            lines += ["#####"] + rows + [".....", ""]
+        else:
+            lines += ["....."] + list(reversed(rows)) + ["#####", ""]
+
+    write_lines(path, lines[:-1])
+    return {}
+
+GENERATORS = {
+    f"{day:02}": generator for day, generator in enumerate((
+        day01, day02, day03, day04, day05, day06, day07, day08, day09, day10,
+        day11, day12, day13, day14, day15, day16, day17, day18, day19, day20,
+        day21, day22, day23, day24, day25,
+    ), 1)
+}
@@ -0,0 +1,50 @@
+"""
+Wall time, CPU time, peak memory and work counter measurement
+"""
+
+import contextlib
+import io
+import time
+import tracemalloc
+
+from aoc import counters
+
+def quietly(func, *args, **kwargs):
+    """
+    call func with stdout captured, since the solvers print their answers
+    """
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        result = func(*args, **kwargs)
+    return result, output.getvalue()
+
+def measure(setup, run, repeat=1):
+    """
+    time `run(setup())` (best of `repeat`), then run it once more under tracemalloc
+    to get the peak memory, counting the work done as well; tracemalloc slows things
+    down, so it never overlaps the timing
+
+    returns the measurements and whatever the last run returned
+    """
+    wall = float("inf")
+    cpu = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        run(state)
+        cpu = min(cpu, time.process_time() - cpu_start)
+        wall = min(wall, time.perf_counter() - wall_start)
+
+    state = setup()
+    counters.reset_counters()
+    counters.enable()
+    tracemalloc.start()
+    try:
+        value = run(state)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        counters.disable()
+
+    measured = {"wall": wall, "cpu": cpu, "peak_memory": peak_memory}
+    return measured | {"counters": counters.counter_values()}, value
@@ -0,0 +1,160 @@
+"""
+Empirical scaling curves: each solver over a geometric series of synthetic input sizes
+
+The wall time, peak memory and work counters of every phase are fitted to c * n^k
+by least squares on log-log axes, where n is the input's length in bytes (so a grid
+day that is linear in its cells comes out near 1, not 2).  Anything with k above
+`superlinear` is flagged, which finds the quadratic paths long before real inputs
+are big enough to hurt.
+
+Small timings are mostly interpreter overhead and small peaks mostly the module
+itself, so points under MIN_WALL or MIN_MEMORY are left out of those fits.  Counters
+don't jitter and are always fitted.  A module stops growing once one size takes
+longer than the budget, so a quadratic solver can't stall the whole run.  Every
+engine of a module gets its own curves, so a faster engine shows what it changed.
+"""
+
+import math
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from aoc.days import find_modules, load_module, module_name
+from aoc.engines import REFERENCE, case_name, engines
+from bench.suite import PHASES, run_case, synthetic_cases
+
+MIN_WALL = 0.002
+MIN_MEMORY = 64 * 1024
+
+def geometric_sizes(start, factor, steps):
+    sizes = []
+    size = start
+    for _ in range(steps):
+        if not sizes or round(size) > sizes[-1]:
+            sizes.append(round(size))
+        size *= factor
+    return sizes
+
+def fit_exponent(points):
+    """
+    the slope of log(y) against log(x) by least squares, for (x, y) points;
+    None with fewer than two usable points
+    """
+    logs = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(logs) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread
+
+def fit_phase(samples, phase, superlinear):
+    measured = [(sample["bytes"], sample[phase]) for sample in samples if phase in sample]
+    time = fit_exponent([(n, m["wall"]) for n, m in measured if m["wall"] >= MIN_WALL])
+    memory = fit_exponent(
+        [(n, m["peak_memory"]) for n, m in measured if m["peak_memory"] >= MIN_MEMORY]
+    )
+
+    names = sorted({name for _, m in measured for name in m.get("counters", {})})
+    work = {
+        name: fit_exponent(
+            [(n, m["counters"][name]) for n, m in measured if name in m.get("counters", {})]
+        )
+        for name in names
+    }
+
+    exponents = {"time": time, "memory": memory}
+    exponents |= {f"counter:{name}": k for name, k in work.items()}
+    return {
+        "time_exponent": time,
+        "memory_exponent": memory,
+        "counter_exponents": work,
+        "superlinear": [what for what, k in exponents.items() if k is not None and k > superlinear],
+    }
+
+def scale_module(module_path, sizes, seed, repeat, budget, workdir, generated, progress=None,
+                 engine=REFERENCE):
+    """
+    run one module engine at each size in turn until one fails or takes longer than
+    `budget` seconds
+    """
+    name = case_name(module_name(module_path), engine)
+    samples = []
+    stopped = None
+    cases = synthetic_cases(module_path, sizes, seed, workdir, generated)
+    for input_name, input_path, options in cases:
+        result = run_case(module_path, input_path, options, repeat, engine)
+        if result["status"] != "ok":
+            stopped = f"{input_name}: {result['error']}"
+            break
+
+        sample = {"size": int(input_name.rsplit("-", 1)[1]), "bytes": input_path.stat().st_size}
+        sample |= {phase: result[phase] for phase in PHASES if phase in result}
+        samples.append(sample)
+        if progress:
+            progress(name, sample)
+
+        took = sum(sample[phase]["wall"] for phase in PHASES if phase in sample)
+        if took > budget:
+            stopped = f"{input_name} took {took:.1f}s, over the {budget:g}s budget"
+            break
+
+    return samples, stopped
+
+def run_scaling(days=None, sizes=(), seed=0, repeat=1, budget=10.0, superlinear=1.3, progress=None):
+    """
+    fit the scaling curves of every selected module with a generator, and return them
+    as a JSON-ready dict
+    """
+    modules = {}
+    generated = {}
+    with tempfile.TemporaryDirectory(prefix="aoc-scaling-") as workdir:
+        for module_path in find_modules(days):
+            for engine in engines(load_module(module_path)):
+                samples, stopped = scale_module(
+                    module_path, sizes, seed, repeat, budget, workdir, generated, progress, engine
+                )
+                if not samples and not stopped:
+                    continue
+                modules[case_name(module_name(module_path), engine)] = {
+                    "samples": samples,
+                    "stopped": stopped,
+                    "curves": {
+                        phase: fit_phase(samples, phase, superlinear)
+                        for phase in PHASES if any(phase in sample for sample in samples)
+                    },
+                }
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "sizes": list(sizes),
+        "superlinear": superlinear,
+        "modules": modules,
+    }
+
+def format_exponent(exponent):
+    return f"{exponent:8.2f}" if exponent is not None else f"{'-':>8}"
+
+def format_scaling(results):
+    """
+    one row per module and phase: the fitted exponents, and what grows faster than linearly
+    """
+    rows = [f"{'module':<24} {'phase':<6} {'time k':>8} {'memory k':>8}  superlinear"]
+    for name, module in results["modules"].items():
+        for phase, curve in module["curves"].items():
+            flagged = ", ".join(curve["superlinear"])
+            rows.append(
+                f"{name:<24} {phase:<6} {format_exponent(curve['time_exponent'])}"
+                f" {format_exponent(curve['memory_exponent'])}  {flagged}"
+            )
+        if module["stopped"]:
+            rows.append(f"{name:<24} stopped at {module['stopped']}")
+    return "\n".join(rows)
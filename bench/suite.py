@@ -0,0 +1,118 @@
+"""
+Run the solvers over fixtures and synthetic inputs, collecting measurements
+
+Every engine a script has (see aoc.engines) is measured on the same inputs as its
+reference, under its own case name, and its answers are checked against the
+reference's; a disagreement marks the case as a mismatch.
+"""
+
+import platform
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aoc.days import call_part, find_inputs, find_modules, load_module, module_name
+from aoc.engines import REFERENCE, case_name, engine_functions, engines
+from aoc.options import options_for
+from bench.generators import GENERATORS
+from bench.measure import measure, quietly
+
+PHASES = ("parse", "part1", "part2")
+
+def run_case(module_path, input_path, options, repeat, engine=REFERENCE):
+    """
+    measure parsing and each part of one solver engine on one input, every run
+    starting from a freshly loaded module; failures are recorded rather than raised
+    """
+    def load():
+        return engine_functions(load_module(module_path), engine)
+
+    def load_and_parse():
+        functions = load()
+        return functions, functions["parse"](input_path)
+
+    result = {"status": "ok", "options": options, "answers": {}}
+    try:
+        result["parse"], _ = measure(load, lambda functions: functions["parse"](input_path), repeat)
+        for name in PHASES[1:]:
+            if name not in load():
+                continue
+            def run(state, name=name):
+                functions, parsed = state
+                answer, _ = quietly(call_part, functions[name], parsed, options)
+                return answer
+            result[name], result["answers"][name] = measure(load_and_parse, run, repeat)
+    except Exception as error: # pylint: disable=broad-exception-caught
+        result["status"] = "error"
+        result["error"] = "".join(traceback.format_exception_only(error)).strip()
+
+    return result
+
+def check_answers(result, reference):
+    """
+    mark an engine's result as a mismatch where its answers differ from the reference's
+    """
+    if result["status"] != "ok" or reference["status"] != "ok":
+        return
+    wrong = [
+        f"{name}: {answer!r}, reference {reference['answers'][name]!r}"
+        for name, answer in result["answers"].items()
+        if name in reference["answers"] and answer != reference["answers"][name]
+    ]
+    if wrong:
+        result["status"] = "mismatch"
+        result["error"] = "answers differ from the reference: " + "; ".join(wrong)
+
+def fixture_cases(module_path, pattern):
+    day = module_path.parent.name
+    for input_path in find_inputs(module_path, pattern):
+        yield input_path.name, input_path, options_for(day, input_path.name)
+
+def synthetic_cases(module_path, sizes, seed, workdir, generated):
+    """
+    generate (or reuse, when a day has several modules) one input per size
+    """
+    day = module_path.parent.name
+    generator = GENERATORS.get(day)
+    if not generator:
+        return
+
+    for size in sizes:
+        if (day, size) not in generated:
+            input_path = Path(workdir) / f"{day}-{size}.txt"
+            generated[(day, size)] = input_path, generator(input_path, size, seed)
+        input_path, options = generated[(day, size)]
+        yield f"synthetic-{size}", input_path, options
+
+def run_suite(days=None, pattern="*.txt", sizes=(), seed=0, repeat=1, progress=None):
+    """
+    benchmark every selected module (and each of its engines) and return the results
+    as a JSON-ready dict
+    """
+    cases = {}
+    generated = {}
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as workdir:
+        for module_path in find_modules(days):
+            name = module_name(module_path)
+            module_engines = engines(load_module(module_path))
+            inputs = list(fixture_cases(module_path, pattern))
+            inputs += list(synthetic_cases(module_path, sizes, seed, workdir, generated))
+            for input_name, input_path, options in inputs:
+                for engine in module_engines:
+                    case = f"{case_name(name, engine)}:{input_name}"
+                    cases[case] = run_case(module_path, input_path, options, repeat, engine)
+                    if engine != REFERENCE:
+                        check_answers(cases[case], cases[f"{name}:{input_name}"])
+                    if progress:
+                        progress(case, cases[case])
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "cases": cases,
+    }
@@ -5,17 +5,35 @@ Advent of Code 2024-NEWDAY
 """
 
 import argparse
+import sys
+from pathlib import Path
 
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-def main(inputfile):
-    with open(inputfile, 'r', encoding='utf-8') as file:
-        grid = [list(line.strip()) for line in file]
+from aoc.inputs import read_text # pylint: disable=wrong-import-position
+from aoc.profiling import add_profiling_arguments, run_profiled # pylint: disable=wrong-import-position
+
+
+def parse(source):
+    return [list(line) for line in read_text(source).splitlines()]
 
-    print(grid)
+def part1(grid):
+    return grid
+
+def part2(grid): # pylint: disable=unused-argument
+    return None
+
+def main(inputfile):
+    grid = parse(inputfile)
+    print(part1(grid))
+    print(part2(grid))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2024-NEWDAY")
     parser.add_argument("input", help="input data file")
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
-    main(args.input)
+    run_profiled(args, main, args.input)